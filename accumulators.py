@@ -0,0 +1,168 @@
+#Import other python libraries
+import random #for sampling free responses
+from collections import Counter #for counting responses quickly
+
+#Import my other python files
+from question_classes import NumericQn #python file containing classes for each question type (NumericQn is used to check numeric responses)
+
+class ResponseCounts:
+    """
+    Keeps the number of responses per choice for a question, so that new responses can be added without going through the old ones again
+    For numeric questions this is a histogram of the valid responses (which also gives their sum), and the positions of the invalid responses are kept as well
+    For free response questions this is the deduplicated corpus, with the number of times each response was given
+    """
+    def __init__(self, qnType):
+        """
+        Initialises an empty set of counts for a question of the given type
+
+        >>> counts = ResponseCounts("categorical")
+        >>> counts.add(["Yes", "No", "Yes"])
+        >>> counts.add(["Maybe", "Yes"])
+        >>> counts.counts
+        {'Yes': 3, 'No': 1, 'Maybe': 1}
+        >>> counts.rows
+        5
+        """
+        self.qnType = qnType #the type of question the responses are for
+        self.counts = { } #the number of responses per choice
+        self.invalidRows = [ ] #the positions (counting from 1) of the responses that are not numbers (numeric questions only)
+        self.rows = 0 #the number of rows gone through so far (including any empty rows skipped in between)
+
+    def add(self, newResponses, positions=None):
+        """
+        Adds a list of new responses to the counts
+        positions is the position of each response counting from the last row added (e.g. [1, 3] if an empty row was skipped between them), so that the positions of the invalid responses are the same as when every row is read
+        By default, the responses follow on one after another
+
+        >>> counts = ResponseCounts("numeric")
+        >>> counts.add([4, 5, "x"])
+        >>> counts.add([4, None])
+        >>> counts.add(["y", 5], [2, 3])
+        >>> counts.counts, counts.invalidRows
+        ({4: 2, 5: 2}, [3, 5, 7])
+        """
+        if positions is None:
+            positions = range(1, len(newResponses)+1)
+        if self.qnType == "numeric": #numeric responses are checked and counted with NumPy, all at once
+            values, invalidRows = NumericQn._toArray(newResponses)
+            choices, freqs = NumericQn._count(values)
+            for choice, freq in zip(choices.tolist(), freqs.tolist()):
+                self.counts[choice] = self.counts.get(choice, 0) + freq
+            self.invalidRows += [self.rows+positions[row-1] for row in invalidRows] #the positions are counted from the first row ever added
+        else:
+            for choice, freq in Counter(newResponses).items():
+                self.counts[choice] = self.counts.get(choice, 0) + freq
+        if len(newResponses):
+            self.rows += positions[-1]
+
+class ResponseSample:
+    """
+    Keeps a random sample of at most sampleSize responses to a free response question (reservoir sampling), so that the memory used does not grow with the number of respondents
+    Every response has the same chance of being in the sample, and while there are no more than sampleSize responses, the sample contains all of them
+    """
+    def __init__(self, sampleSize, seed=0):
+        """
+        Initialises an empty sample
+
+        >>> sample = ResponseSample(3)
+        >>> sample.add(["a", "b", "a", "c", "d", "e"])
+        >>> len(sample.sample), sample.rows
+        (3, 6)
+        """
+        self.sampleSize = sampleSize #the maximum number of responses kept
+        self.sample = [ ] #the responses in the sample
+        self.rows = 0 #the number of responses added so far
+        self.random = random.Random(seed) #a fixed seed, so that the same responses always give the same sample
+
+    def add(self, newResponses):
+        """
+        Adds a list of new responses to the sample
+        """
+        for response in newResponses:
+            self.rows += 1
+            if len(self.sample) < self.sampleSize: #the sample is not full yet, so every response is kept
+                self.sample.append(response)
+            else: #otherwise, the response replaces a random response in the sample with a chance of sampleSize/rows
+                position = self.random.randrange(self.rows)
+                if position < self.sampleSize:
+                    self.sample[position] = response
+
+    @property
+    def counts(self):
+        """
+        The number of times each response appears in the sample
+
+        >>> sample = ResponseSample(5)
+        >>> sample.add(["a", "b", "a"])
+        >>> sample.counts
+        {'a': 2, 'b': 1}
+        """
+        return dict(Counter(self.sample))
+
+def new_accumulators(questions, sampleSize=None):
+    """
+    Returns an empty accumulator for each question that is analysed (free response questions are sampled if sampleSize is given)
+    """
+    accumulators = { }
+    for qnNo, qnType in questions.items():
+        if qnType == "free-response" and sampleSize is not None:
+            accumulators[qnNo] = ResponseSample(sampleSize)
+        elif qnType != "demographic":
+            accumulators[qnNo] = ResponseCounts(qnType)
+    return accumulators
+
+def accumulate(accumulators, questions, rows, batchSize=1000):
+    """
+    Goes through the rows (the responses of each respondent) once, adding them to the accumulator of each question
+    The rows are added in batches of batchSize, so that numeric responses can be checked and counted all at once while only a batch is kept in memory
+    Empty rows (e.g. formatted rows that the form has not written to yet) are not counted as respondents, but they still count towards the positions of the invalid responses, just like when every row is read
+    Returns the number of rows gone through, up to and including the last row with any response in it, so that trailing empty rows are read again next time
+
+    >>> accumulators = new_accumulators({"1": "demographic", "2": "numeric", "3": "categorical"})
+    >>> accumulate(accumulators, {"1": "demographic", "2": "numeric", "3": "categorical"}, [("Amy", 4, "Yes"), (None, None, None), ("Ben", 5, "No"), ("Cat", 4, "Yes"), (None, None, None)], batchSize=2)
+    4
+    >>> accumulators["2"].counts, accumulators["3"].counts
+    ({4: 2, 5: 1}, {'Yes': 2, 'No': 1})
+    >>> accumulate(accumulators, {"1": "demographic", "2": "numeric", "3": "categorical"}, [(None, None, None), ("Dan", "x", "No")])
+    2
+    >>> accumulators["2"].invalidRows
+    [6]
+    """
+    columns = [(i, accumulators[qnNo]) for i, qnNo in enumerate(questions) if qnNo in accumulators] #the position of each column that is analysed, along with its accumulator
+    columnCount = len(questions)
+    rowCount = 0 #the number of rows gone through
+    filledCount = 0 #the number of rows up to and including the last row with any response in it
+    batch = [ ] #the rows waiting to be added
+    positions = [ ] #the position of each row in the batch, counting from the last row added
+    for row in rows:
+        rowCount += 1
+        if all(cell is None or cell == "" for cell in row): #empty rows are skipped, but still counted if a row with responses comes after them
+            continue
+        positions.append(rowCount-filledCount+(positions[-1] if positions else 0)) #any empty rows since the last row with responses are counted too
+        filledCount = rowCount
+        if len(row) < columnCount: #pads the row in case the trailing cells are missing
+            row = tuple(row) + (None,)*(columnCount-len(row))
+        batch.append(row)
+        if len(batch) == batchSize:
+            _addBatch(columns, batch, positions)
+            batch, positions = [ ], [ ]
+    _addBatch(columns, batch, positions)
+    return filledCount
+
+def _addBatch(columns, batch, positions):
+    """
+    Adds a batch of rows to the accumulators, one column at a time, along with the position of each row (see ResponseCounts.add())
+    """
+    for i, accumulator in columns:
+        if isinstance(accumulator, ResponseCounts):
+            accumulator.add([row[i] for row in batch], positions)
+        else: #a sample only needs the responses themselves
+            accumulator.add([row[i] for row in batch])
+    return len(batch)
+
+def make_tasks(questions, header, accumulators, leaveOut, summLen):
+    """
+    Returns the tasks for analysis_pipeline.analyse_tasks(), with the accumulators in place of the lists of responses
+    """
+    header = tuple(header) + (None,)*(len(questions)-len(header)) #pads the header in case the sheet has fewer columns than the config file
+    return [(qnNo, qnType, header[i], accumulators.get(qnNo, [ ]), leaveOut, summLen) for i, (qnNo, qnType) in enumerate(questions.items())]
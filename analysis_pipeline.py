@@ -0,0 +1,168 @@
+#Importing other python libraries
+import contextlib #for contextlib.redirect_stdout()
+import functools #for functools.partial()
+import io #for io.StringIO()
+import queue #for the questions waiting to be written
+import threading #allows me to write the output of one question while the next ones are analysed
+from collections import deque #for the questions handed out to the worker processes
+from concurrent.futures import ProcessPoolExecutor #allows me to analyse several questions at the same time
+
+#Importing my other python files
+from question_classes import NumericQn, CategoricalQn, FreeResponseQn, DemographicQn #python file containing classes for each question type, with functions to evaluate them
+from accumulators import ResponseCounts, ResponseSample #python file containing the counts used in incremental and streaming mode
+import instrumentation #python file to measure the time and memory used by each question
+import crosstab #python file to break down the responses by demographic groups
+
+def build_question(qnNo, qnType, qnStatement, qnResponse):
+    """
+    Returns the object of the required question class for the question
+    qnResponse can either be a list of responses or an accumulator (a ResponseCounts or ResponseSample object, in incremental and streaming mode)
+
+    >>> build_question("2", "numeric", "Rate the course", [4, 5, 4]).__class__.__name__
+    'NumericQn'
+    >>> build_question("1", "demographic", "Your Name", [ ]).__class__.__name__
+    'DemographicQn'
+    """
+    if isinstance(qnResponse, (ResponseCounts, ResponseSample)) and qnType != "demographic": #the question is created from the counts in the accumulator
+        if qnType == "numeric":
+            return NumericQn.fromCounts(qnNo, qnStatement, qnResponse.counts, qnResponse.invalidRows)
+        return (CategoricalQn if qnType == "categorical" else FreeResponseQn).fromCounts(qnNo, qnStatement, qnResponse.counts)
+    if qnType == "numeric":
+        return NumericQn(qnNo, qnStatement, qnResponse) #responses that are not numbers are reported and left out
+    elif qnType == "categorical":
+        return CategoricalQn(qnNo, qnStatement, qnResponse)
+    elif qnType == "free-response":
+        return FreeResponseQn(qnNo, qnStatement, qnResponse)
+    else:
+        return DemographicQn(qnNo, qnStatement)
+
+def analyse_question(task, cache=None, measured=False, charts=True, groups=None, chunkSize=None, summaryJobs=1, bins=None):
+    """
+    Builds the question and works out everything the output methods need (the statistics, the pie chart and the summary), so that they are saved in the question object
+    If charts is False, the pie chart is not drawn (e.g. when no Word document is written)
+    If a GroupIndex is given, the responses to numeric and categorical questions are also broken down by group
+    If chunkSize is given, free response questions are summarised in chunks of that many responses, in summaryJobs worker processes
+    If bins is given, numeric questions with too many different responses to list are grouped into that many ranges (instead of NumericQn.bins)
+    If a ResultCache is given, the results are taken from it when the question has been analysed before, and saved to it otherwise
+    Anything printed along the way is captured, so that it can be printed later in the correct order
+    If measured is True, the wall time, CPU time and peak memory of the analysis are measured as well
+    Returns the question object, the captured text and the measurements (None if they were not measured)
+
+    >>> question, printed, measurements = analyse_question(("2", "numeric", "Rate the course", [4, "x", 4], [ ], 5))
+    >>> question.stats().frequency
+    {4: 2}
+    >>> printed
+    'Error: Numeric questions should have integer responses (Q2: responses 2 are left out)\\n'
+    >>> measurements is None
+    True
+    """
+    printed = io.StringIO()
+    measurements = { } if measured else None
+    with contextlib.redirect_stdout(printed), (instrumentation.measure(measurements, perThread=True) if measured else contextlib.nullcontext()):
+        question = _analyse(task, cache, charts, groups, chunkSize, summaryJobs, bins)
+    return question, printed.getvalue(), measurements
+
+def _analyse(task, cache, charts, groups, chunkSize, summaryJobs, bins):
+    """
+    Builds the question and works out its results (taking them from the cache if possible)
+    """
+    qnNo, qnType, qnStatement, qnResponse, leaveOut, summLen = task
+    question = build_question(qnNo, qnType, qnStatement, qnResponse)
+    if qnType == "demographic": #demographic questions have nothing to work out
+        return question
+    if qnType == "free-response": #the summary settings are set before the cache is read, since they change the summary
+        question.chunkSize, question.summaryJobs = chunkSize, summaryJobs
+    if qnType == "numeric" and bins is not None: #the number of ranges is also set before the cache is read, since it changes the statistics and the chart
+        question.bins = bins
+    changed = cache is None or not cache.load(question, leaveOut, summLen) #the results of questions that have not changed are already in the cache
+    if qnType in ("numeric", "categorical"):
+        if question.stats().count > 0 and charts and question._chart is None: #a pie chart cannot be drawn if none of the responses are valid, and results cached by a run without charts do not have one yet
+            question.chart() #the pie chart is drawn in memory here, and only saved to a file by the output methods
+            changed = True
+    elif qnType == "free-response" and changed:
+        question.summarize(sentenceNo=summLen, leaveOut=leaveOut)
+    if cache is not None and changed:
+        cache.save(question, leaveOut, summLen)
+    if groups is not None and qnType in ("numeric", "categorical"): #the breakdown is not cached, since it depends on the groups as well
+        question.crossTab = crosstab.cross_tab(groups, qnType, qnResponse, question.bins) if qnType == "numeric" else crosstab.cross_tab(groups, qnType, qnResponse)
+    return question
+
+def make_tasks(questions, responses, leaveOut, summLen):
+    """
+    Returns the information needed to analyse each question (in the form taken by analyse_question()), from the 2D list returned by openExcel()
+
+    >>> make_tasks({"1": "demographic", "2": "numeric"}, [["Your Name"], ["Rate the course", 4, 5]], [ ], 5)
+    [('1', 'demographic', 'Your Name', [], [], 5), ('2', 'numeric', 'Rate the course', [4, 5], [], 5)]
+    """
+    tasks = [ ] #the information needed to analyse each question
+    qnCount = 0 #keeps count of the questions (so that the relevant response list can be obtained)
+    for qnNo, qnType in questions.items(): #iterates through the dictionary of questions (containing the question number and the type of question)
+        qnResponse = responses[qnCount] #gets the relevent response list for the question (containing the question statement and the list of responses)
+        tasks.append((qnNo, qnType, qnResponse[0], qnResponse[1:], leaveOut, summLen)) #the question statement is in row A of the excel sheet, and the rest of the list are the responses
+        qnCount += 1 #update the question count
+    return tasks
+
+def analyse_tasks(tasks, jobs=1, cache=None, measured=False, charts=True, groups=None, chunkSize=None, summaryJobs=1, bins=None):
+    """
+    Analyses each task (in the form taken by analyse_question()), in a pool of jobs worker processes if jobs is more than 1
+    Yields the question object, the text printed while analysing it and the measurements (if measured is True), in the same order as the tasks
+    At most two questions per worker are handed out at a time, so the analysed questions waiting to be output do not pile up in memory
+    """
+    analyse = functools.partial(analyse_question, cache=cache, measured=measured, charts=charts, groups=groups, chunkSize=chunkSize, summaryJobs=summaryJobs, bins=bins) #every question uses the same cache, groups and settings
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            pending = deque() #the questions handed out to the workers, in order (so the results come back in the same order as the tasks, even if they finish in a different order)
+            for task in tasks:
+                pending.append(pool.submit(analyse, task))
+                if len(pending) >= jobs*2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    else:
+        yield from map(analyse, tasks)
+    if cache is not None:
+        cache.evict() #keeps the cache within its size limit, once all the questions have been analysed
+
+_DONE = object() #tells the writer thread that every question has been analysed
+
+def write_in_order(results, write, queueSize=4, writerContext=contextlib.nullcontext):
+    """
+    Calls write() on each result (e.g. from analyse_tasks() with jobs more than 1) in a single writer thread, in the same order as the results
+    While one question is written, the main thread keeps handing out the next questions to the worker processes, instead of leaving them idle once their few questions are done
+    At most queueSize analysed questions wait to be written (on top of the ones still being analysed)
+    If write() raises an exception, the remaining questions are not analysed and the exception is raised again here
+    The writer thread runs inside writerContext() (e.g. RunReport.thread(), so that it is profiled as well)
+    The results must not be analysed in the main thread, since anything the writer thread prints at the same time would be captured along with the messages of the question being analysed
+
+    >>> write_in_order(iter([("Q1", 1), ("Q2", 2)]), lambda qnNo, number: print(qnNo, number))
+    Q1 1
+    Q2 2
+    """
+    pending = queue.Queue(maxsize=queueSize) #the results waiting to be written, in order
+    errors = [ ] #the exception raised by write(), if any
+    def writer():
+        """
+        Writes each result as soon as it is ready, until every question has been analysed
+        """
+        with writerContext():
+            while True:
+                result = pending.get()
+                if result is _DONE:
+                    return
+                if not errors: #once write() has failed, the rest of the results are thrown away
+                    try:
+                        write(*result)
+                    except BaseException as error:
+                        errors.append(error)
+    writerThread = threading.Thread(target=writer, name="writer")
+    writerThread.start()
+    try:
+        for result in results:
+            if errors: #stops analysing the questions, since they cannot be written
+                break
+            pending.put(result) #waits if the writer thread is too far behind
+    finally:
+        pending.put(_DONE)
+        writerThread.join()
+    if errors:
+        raise errors[0]
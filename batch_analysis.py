@@ -0,0 +1,130 @@
+#Importing my other python files
+import cs_survey_analysis #python file containing the main program. Functions from this file: run_survey(configName="config.txt", ...)
+from result_cache import ResultCache #python file containing the cache of results for questions that have already been analysed
+
+#Importing other python libraries
+import argparse #allows me to read the options given when running the program
+import contextlib #for contextlib.redirect_stdout()
+import io #for io.StringIO()
+import os
+import time #for the runtime of each survey
+from concurrent.futures import ProcessPoolExecutor, as_completed #allows me to analyse several surveys at the same time
+
+def find_configs(paths):
+    """
+    Returns the config files to analyse, from a list of config files and folders (every .txt file in a folder is treated as a config file)
+    """
+    configs = [ ]
+    for path in paths:
+        if os.path.isdir(path):
+            configs += sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".txt"))
+        else:
+            configs.append(path)
+    return configs
+
+def output_folders(configs, outputDir):
+    """
+    Returns the folder that the output of each survey is saved in, so that every survey has its own folder
+    The folders are named after the config files, along with the folders they are in if some config files have the same name
+
+    >>> output_folders(["term1/class_3a.txt", "term1/class_3b.txt"], "batch_output")
+    ['batch_output/class_3a', 'batch_output/class_3b']
+    >>> output_folders(["term1/3a/config.txt", "term1/3b/config.txt"], "batch_output")
+    ['batch_output/3a/config', 'batch_output/3b/config']
+    """
+    names = [os.path.splitext(os.path.basename(configName))[0] for configName in configs]
+    if len(set(names)) == len(names): #every config file has a different name
+        return [os.path.join(outputDir, name) for name in names]
+    folders = [os.path.dirname(os.path.abspath(configName)) for configName in configs]
+    common = os.path.commonpath(folders) #the folder containing all the config files, which is left out of the names
+    return [os.path.normpath(os.path.join(outputDir, os.path.relpath(folder, common), name)) for folder, name in zip(folders, names)]
+
+def warm_up():
+    """
+    Loads the summariser and draws a throwaway chart, so that sumy's resources and matplotlib's font cache are loaded once per worker process instead of once per survey
+    """
+    from question_classes import CategoricalQn #python file containing classes for each question type
+    from summariser import get_summariser #python file containing the summariser shared by all free response questions
+    import docx #allows me to write to a Microsoft Word Document
+    get_summariser()
+    CategoricalQn(0, "Warm-up", ["Yes", "No"]).chart()
+
+def analyse_survey(configName, folder, options):
+    """
+    Analyses one survey, saving its output (including everything it prints, in console.txt) in its own folder
+    The relative file names in the config file are read from the folder containing the config file, just like when the main program is run in that folder
+    Returns the name of the config file, whether the survey was analysed, the runtime and either the name of the Word Document or the reason it failed
+    """
+    start = time.perf_counter()
+    folder = os.path.abspath(folder)
+    os.makedirs(folder, exist_ok=True)
+    printed = io.StringIO() #everything printed while analysing the survey, which would be mixed up with the other surveys if it was printed straight away
+    workingDir = os.getcwd()
+    try:
+        os.chdir(os.path.dirname(os.path.abspath(configName)) or ".")
+        with contextlib.redirect_stdout(printed):
+            result = cs_survey_analysis.run_survey(os.path.basename(configName), outputDir=folder, **options)
+        if result == "ERROR": #the error has already been printed, so the last line printed explains what went wrong
+            lines = printed.getvalue().strip().splitlines()
+            ok, detail = False, lines[-1] if lines else "ERROR"
+        else:
+            ok, detail = True, result
+    except Exception as error: #one broken survey should not stop the rest of the batch
+        ok, detail = False, "{}: {}".format(error.__class__.__name__, error)
+    finally:
+        os.chdir(workingDir)
+    with open(os.path.join(folder, "console.txt"), "w", encoding="utf-8") as consoleFile:
+        consoleFile.write(printed.getvalue())
+    return configName, ok, time.perf_counter()-start, detail
+
+def run_batch(configs, outputDir="batch_output", jobs=1, **options):
+    """
+    Analyses every survey, in a pool of jobs worker processes if jobs is more than 1
+    Each worker process is warmed up once and then reused for many surveys
+    Returns the result of each survey (from analyse_survey()), in the same order as configs
+    """
+    results = [None]*len(configs)
+    folders = output_folders(configs, outputDir)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up) as pool:
+            futures = {pool.submit(analyse_survey, configName, folder, options): i for i, (configName, folder) in enumerate(zip(configs, folders))}
+            for done, future in enumerate(as_completed(futures), 1): #prints the progress as each survey finishes
+                results[futures[future]] = future.result()
+                print("[{}/{}] {}".format(done, len(configs), results[futures[future]][0]))
+    else:
+        warm_up()
+        for i, configName in enumerate(configs):
+            results[i] = analyse_survey(configName, folders[i], options)
+            print("[{}/{}] {}".format(i+1, len(configs), configName))
+    return results
+
+def print_summary(results):
+    """
+    Prints a table with the runtime of each survey and whether it failed
+    """
+    width = max([len("Config")] + [len(configName) for configName, ok, runtime, detail in results])
+    print("\n{:<{width}}  {:<6}  {:>9}  {}".format("Config", "Status", "Time (s)", "Output / error", width=width))
+    for configName, ok, runtime, detail in results:
+        print("{:<{width}}  {:<6}  {:>9.2f}  {}".format(configName, "OK" if ok else "FAILED", runtime, detail, width=width))
+    failures = sum(1 for result in results if not result[1])
+    print("\n{} surveys analysed, {} failed, {:.2f}s in total".format(len(results), failures, sum(result[2] for result in results)))
+
+####################
+### Main program ###
+####################
+
+if __name__ == "__main__": #the worker processes import this file too, so the program only runs when this file is run directly
+    parser = argparse.ArgumentParser(description="Analyses many surveys at once, each described by its own config file")
+    parser.add_argument("configs", nargs="+", help="config files, or folders containing config files (every .txt file in them)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of surveys analysed at the same time (default: 1)")
+    parser.add_argument("--output-dir", default="batch_output", help="folder to save the output of each survey in, with a folder for each config file (default: batch_output)")
+    parser.add_argument("--output", choices=cs_survey_analysis.OUTPUTS, default="docx", help="where to output the analysis of each survey (default: docx)")
+    parser.add_argument("--incremental", action="store_true", help="save the counts for each question, so that the next batch only reads the new responses")
+    parser.add_argument("--streaming", action="store_true", help="read the responses one row at a time into counts for each question")
+    parser.add_argument("--cache-dir", default=".survey_cache", help="folder to save the results of each question in, shared by every survey (default: .survey_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="analyse every question again, without reading or writing the cache")
+    args = parser.parse_args()
+    configs = find_configs(args.configs)
+    cache = None if args.no_cache else ResultCache(os.path.abspath(args.cache_dir)) #an absolute path, since each survey is analysed in the folder of its config file
+    results = run_batch(configs, args.output_dir, args.jobs, savePies=False, incrementalMode=args.incremental, cache=cache, streamingMode=args.streaming, output=args.output) #the pie charts are only added to the Word Documents, since their files would have the same names in every survey
+    print_summary(results)
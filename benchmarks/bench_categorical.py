@@ -0,0 +1,42 @@
+"""
+Compares the dictionary-encoded CategoricalQn against the generic Qn class (which keeps a sorted list of every response) on large categorical columns
+Measures the time taken to build the question and work out its statistics, and the memory kept by the question afterwards
+
+Usage: python benchmarks/bench_categorical.py [respondents ...]
+"""
+#Importing other python libraries
+import os
+import random
+import sys
+import time
+import tracemalloc #for the memory kept by each question
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+from question_classes import Qn, CategoricalQn
+
+def measure(qnClass, responses):
+    """
+    Returns the time taken to build the question and work out its statistics, the memory kept by the question (in MB) and its frequency
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    question = qnClass(1, "Would you use Microbit again?", responses)
+    frequency = question.frequency()
+    wall = time.perf_counter() - start
+    kept = tracemalloc.get_traced_memory()[0]/1024.0/1024.0
+    tracemalloc.stop()
+    return wall, kept, frequency
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [10000, 100000, 1000000]
+    rng = random.Random(0)
+    print("{:>12} {:>8} {:>10} {:>12} {:>10} {:>13} {:>6}".format("respondents", "choices", "Qn (s)", "encoded (s)", "Qn (MB)", "encoded (MB)", "same"))
+    for respondents in sizes:
+        for choices in (["Yes", "No", "Maybe"], ["Choice {}".format(i) for i in range(50)]):
+            responses = [rng.choice(choices) for i in range(respondents)]
+            listTime, listMem, listFreq = measure(Qn, responses)
+            codeTime, codeMem, codeFreq = measure(CategoricalQn, responses)
+            same = listFreq == codeFreq and list(listFreq) == list(codeFreq) #the same counts, in the same order
+            print("{:>12} {:>8} {:>10.3f} {:>12.3f} {:>10.2f} {:>13.2f} {:>6}".format(respondents, len(choices), listTime, codeTime, listMem, codeMem, str(same)))
@@ -0,0 +1,72 @@
+"""
+Measures the time and memory per chart for the old pie chart code (drawn and saved by both output methods, figures never closed)
+against the new chart pipeline (drawn once in memory, figure closed, saved to a file once)
+Each pipeline runs in its own process, so the peak RSS of one pipeline does not affect the other
+
+Usage: python benchmarks/bench_charts.py [number of charts]
+"""
+#Importing other python libraries
+import math
+import multiprocessing #runs each pipeline in a fresh process
+import os
+import resource #for the peak RSS of a process
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+def plotPieOld(question):
+    """
+    The old plot_pie(), kept here as the baseline: draws on a new figure and saves it to a file, without closing the figure
+    """
+    from matplotlib import pyplot as plt
+    pieChart = plt.subplots()[1]
+    pieChart.set_title("Q{}: {}".format(question.qNumber, question.qStatement))
+    choices = question.frequency().keys()
+    exact = question.frequency().values()
+    percent = question.freqPercent().values()
+    pieChart.pie(percent, autopct=lambda pct: "{}\n({:.1f}%)".format(int(math.ceil((pct/100)*sum(exact))), pct), startangle=90)
+    pieChart.legend(choices, title="Choices", loc="center left", bbox_to_anchor=(0.85, 0, 0.5, 1))
+    pieChart.axis('equal')
+    pieName = "Q{}_pie.png".format(question.qNumber)
+    plt.savefig(pieName, bbox_inches='tight', pad_inches=0.5)
+    return pieName
+
+def measure(pipeline, charts, folder, queue):
+    """
+    Draws the given number of charts with one of the pipelines and puts the time and the growth in peak RSS (in MB) per chart onto the queue
+    """
+    os.chdir(folder) #the PNG files are saved in a temporary folder
+    from question_classes import CategoricalQn
+    questions = [CategoricalQn(i, "Question {}".format(i), ["Yes", "No", "Maybe"]*(i+1)+["Yes"]) for i in range(charts)]
+    questions[0].chart() #draws one chart beforehand, so that loading fonts is not counted
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for question in questions:
+        if pipeline == "old": #the old pipeline drew every chart once for the console and again for the Word document
+            plotPieOld(question)
+            plotPieOld(question)
+        else:
+            question.plot_pie() #saves the file for the console
+            question.chart() #the Word document uses the same PNG data from memory
+    wall = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((wall/charts, (after-before)/1024.0/charts)) #ru_maxrss is in kilobytes on Linux
+
+def run(pipeline, charts, folder):
+    context = multiprocessing.get_context("spawn") #a fresh interpreter for every measurement
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(pipeline, charts, folder, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+if __name__ == "__main__":
+    charts = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    with tempfile.TemporaryDirectory() as tmp:
+        print("{:>10} {:>16} {:>16}".format("pipeline", "time/chart (ms)", "RSS/chart (MB)"))
+        for pipeline in ("old", "new"):
+            perChart, memPerChart = run(pipeline, charts, tmp)
+            print("{:>10} {:>16.1f} {:>16.2f}".format(pipeline, perChart*1000, memPerChart))
@@ -0,0 +1,67 @@
+"""
+Compares summarising a free response question in one pass against summarising it in chunks (and then summarising the summaries of the chunks)
+Measures the time taken and the peak memory used, and checks the quality of the chunked summary against the one-pass summary:
+ * common – the number of sentences that are in both summaries
+ * rating – the average Luhn rating of the summary's sentences, using the significant words of the whole column (higher is better)
+
+With --jobs, the memory is only measured in the main process (each worker holds one chunk at a time)
+
+Usage: python benchmarks/bench_chunked.py [respondents ...] [--chunk-size N] [--jobs N]
+"""
+#Importing other python libraries
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc #for the peak memory used by each summary
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing other libraries from external sources
+from sumy.models.dom import ObjectDocumentModel, Paragraph, Sentence
+
+#Importing my other python files
+from summariser import Summariser
+from synthetic import makeResponse
+
+def measure(responses, leaveOut, chunkSize, jobs):
+    """
+    Returns the time taken, the peak memory used (in MB) and the summary, using a new summariser so that no saved summary is reused
+    The memory is measured in a second run, since tracemalloc slows the summariser down a lot
+    """
+    start = time.perf_counter()
+    summary = Summariser().summarize(responses, 5, leaveOut, chunkSize, jobs)
+    wall = time.perf_counter() - start
+    tracemalloc.start()
+    Summariser().summarize(responses, 5, leaveOut, chunkSize, jobs)
+    peak = tracemalloc.get_traced_memory()[1]/1024.0/1024.0
+    tracemalloc.stop()
+    return wall, peak, summary
+
+def rating(summariser, responses, leaveOut, summary):
+    """
+    Returns the average rating of the sentences in the summary, using the significant words of every response
+    """
+    unique = summariser.preprocess(responses, leaveOut)
+    document = ObjectDocumentModel([Paragraph([Sentence(r + ".", summariser.tokenizer) for r, weight in unique])])
+    significant = summariser.luhn.significant_words(document, [weight for r, weight in unique])
+    return sum(summariser.luhn.rate_sentence(Sentence(sentence, summariser.tokenizer), significant) for sentence in summary)/max(len(summary), 1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sizes", type=int, nargs="*", default=[5000, 20000, 50000])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    leaveOut = ["nil", "na", "none", "-"]
+    summariser = Summariser()
+    print("{:>12} {:>11} {:>11} {:>10} {:>11} {:>7} {:>14} {:>15}".format("respondents", "single (s)", "chunked (s)", "single MB", "chunked MB", "common", "single rating", "chunked rating"))
+    for respondents in args.sizes:
+        responses = sorted(makeResponse("free-response", rng) for i in range(respondents)) #questions keep their responses sorted
+        singleTime, singlePeak, single = measure(responses, leaveOut, None, 1)
+        chunkTime, chunkPeak, chunked = measure(responses, leaveOut, args.chunk_size, args.jobs)
+        common = len(set(single) & set(chunked))
+        print("{:>12} {:>11.3f} {:>11.3f} {:>10.1f} {:>11.1f} {:>5}/{} {:>14.2f} {:>15.2f}".format(respondents, singleTime, chunkTime, singlePeak, chunkPeak, common, len(single),
+              rating(summariser, responses, leaveOut, single), rating(summariser, responses, leaveOut, chunked)))
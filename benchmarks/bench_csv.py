@@ -0,0 +1,40 @@
+"""
+Compares reading the same synthetic survey from a CSV file (openCSV()) against reading it from an Excel file (openExcel())
+Also checks that both readers give exactly the same responses for each question
+
+Usage: python benchmarks/bench_csv.py [respondents ...]
+"""
+#Importing other python libraries
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+import excel_functions as ex
+import synthetic
+
+def timed(function, *args):
+    """
+    Returns the result of the function and the time it took (the fastest of 3 runs)
+    """
+    times = [ ]
+    for i in range(3):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [2000, 20000, 100000]
+    questions = synthetic.makeQuestions(demographic=2, numeric=6, categorical=3, freeResponse=2)
+    print("{:>12} {:>12} {:>12} {:>10} {:>10}".format("respondents", "xlsx (s)", "csv (s)", "speedup", "same"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for respondents in sizes:
+            xlName = synthetic.makeWorkbook(os.path.join(tmp, "bench.xlsx"), questions, respondents)
+            csvName = synthetic.makeCSV(os.path.join(tmp, "bench.csv"), questions, respondents)
+            xlResponses, xlTime = timed(ex.openExcel, xlName, "Form responses 1", questions)
+            csvResponses, csvTime = timed(ex.openCSV, csvName, questions)
+            print("{:>12} {:>12.3f} {:>12.3f} {:>9.1f}x {:>10}".format(respondents, xlTime, csvTime, xlTime/csvTime, str(xlResponses == csvResponses)))
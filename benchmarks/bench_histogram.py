@@ -0,0 +1,48 @@
+"""
+Compares listing every different response of a numeric question (one bullet point and one pie slice each) against grouping them into ranges (a short table and a histogram)
+Measures the time taken to draw the chart and write the question to the console and a Word document, and the size of the output
+
+Usage: python benchmarks/bench_histogram.py [different responses ...]
+"""
+#Importing other python libraries
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing other libraries from external sources
+import docx
+
+#Importing my other python files
+from question_classes import NumericQn
+from output_methods import console_output, docx_output
+
+def measure(responses, maxChoices):
+    """
+    Returns the time taken to analyse and output the question, along with the number of lines printed and the number of paragraphs in the Word document
+    """
+    doc = docx.Document()
+    printed = io.StringIO()
+    start = time.perf_counter()
+    question = NumericQn(1, "Minutes spent on homework", responses)
+    question.maxChoices = maxChoices
+    question.chart()
+    with contextlib.redirect_stdout(printed):
+        console_output(question, savePie=False)
+    docx_output(question, doc)
+    return time.perf_counter() - start, printed.getvalue().count("\n"), len(doc.paragraphs)
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [50, 200, 1000]
+    rng = random.Random(0)
+    measure([1, 2, 3], NumericQn.maxChoices) #loads matplotlib and python-docx before anything is timed
+    print("{:>10} {:>11} {:>11} {:>12} {:>12} {:>12} {:>12}".format("different", "listed (s)", "binned (s)", "listed lines", "binned lines", "listed paras", "binned paras"))
+    for different in sizes:
+        responses = [rng.randrange(different) for i in range(20000)]
+        listTime, listLines, listParas = measure(responses, float("inf"))
+        binTime, binLines, binParas = measure(responses, NumericQn.maxChoices)
+        print("{:>10} {:>11.3f} {:>11.3f} {:>12} {:>12} {:>12} {:>12}".format(different, listTime, binTime, listLines, binLines, listParas, binParas))
@@ -0,0 +1,67 @@
+"""
+Compares the load time and peak memory of the streaming openExcel() against the old full-sheet loader
+Each loader runs in its own process, so the peak RSS of one loader does not affect the other
+
+Usage: python benchmarks/bench_open_excel.py [respondents ...]
+"""
+#Importing other python libraries
+import multiprocessing #runs each loader in a fresh process
+import os
+import resource #for the peak RSS of a process
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing other libraries from external sources
+import openpyxl
+
+#Importing my other python files
+import excel_functions as ex
+import synthetic
+
+def openExcelFull(filename, sheetname):
+    """
+    The old loader, kept here as the baseline: loads the whole workbook and copies every cell into a 2D list
+    """
+    workbook = openpyxl.load_workbook(filename)
+    sheet = workbook[sheetname]
+    sheetList = [ ]
+    for column in list(sheet.columns):
+        sheetList.append([cell.value for cell in list(column)])
+    return sheetList
+
+def measure(loader, xlName, questions, queue):
+    """
+    Runs one loader and puts its wall time and the growth in peak RSS (in MB) onto the queue
+    """
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if loader == "full":
+        openExcelFull(xlName, "Form responses 1")
+    else:
+        ex.openExcel(xlName, "Form responses 1", questions)
+    wall = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((wall, (after-before)/1024.0)) #ru_maxrss is in kilobytes on Linux
+
+def run(loader, xlName, questions):
+    context = multiprocessing.get_context("spawn") #a fresh interpreter for every measurement
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(loader, xlName, questions, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 10000, 30000]
+    questions = synthetic.makeQuestions(demographic=4, numeric=6, categorical=2, freeResponse=3)
+    print("{:>12} {:>10} {:>12} {:>12} {:>12} {:>12}".format("respondents", "columns", "full (s)", "stream (s)", "full (MB)", "stream (MB)"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for respondents in sizes:
+            xlName = synthetic.makeWorkbook(os.path.join(tmp, "bench_{}.xlsx".format(respondents)), questions, respondents)
+            fullTime, fullMem = run("full", xlName, questions)
+            streamTime, streamMem = run("stream", xlName, questions)
+            print("{:>12} {:>10} {:>12.2f} {:>12.2f} {:>12.1f} {:>12.1f}".format(respondents, len(questions), fullTime, streamTime, fullMem, streamMem))
@@ -0,0 +1,67 @@
+"""
+Compares analysing and then writing each question in turn against the pipeline used by the main program with --jobs, where a single writer thread outputs each question while the worker processes analyse the next ones
+With jobs=1 the main program does not use the writer thread, since the analysis and the writing would only take turns in the same process
+Reports the total time of each, along with the time spent analysing and writing the questions, so the pipelined total can be compared with the slowest of the two stages
+
+Usage: python benchmarks/bench_pipeline.py [--respondents 2000] [--questions 24] [--jobs 1 2]
+"""
+#Importing other python libraries
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+import synthetic
+import analysis_pipeline
+import output_methods
+from summariser import get_summariser
+
+#Importing other libraries from external sources
+import docx
+
+def run(tasks, jobs, pipelined):
+    """
+    Analyses and writes every question (to the console, a Word Document and PNG files), returning the total time and the time spent writing
+    """
+    get_summariser()._summaries.clear() #so that the summaries from the previous run are not reused
+    doc = docx.Document()
+    writing = [0.0] #the time spent writing, added up over every question
+    def write(question, printed, analysed):
+        start = time.perf_counter()
+        output_methods.console_output(question)
+        output_methods.docx_output(question, doc)
+        writing[0] += time.perf_counter() - start
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analysed = analysis_pipeline.analyse_tasks(tasks, jobs)
+        if pipelined:
+            analysis_pipeline.write_in_order(analysed, write)
+        else:
+            for result in analysed:
+                write(*result)
+        doc.save("bench.docx")
+    return time.perf_counter() - start, writing[0]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--respondents", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=24, help="number of numeric and categorical questions (half each), along with 2 free response questions")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args()
+    questions = synthetic.makeQuestions(0, args.questions//2, args.questions-args.questions//2, 2)
+    rows = list(synthetic.makeRows(questions, args.respondents, cardinality=6))
+    responses = [list(column) for column in zip(*rows)] #one list per question, starting with the question statement
+    tasks = analysis_pipeline.make_tasks(questions, responses, ["nil"], 5)
+    os.chdir(tempfile.mkdtemp()) #the pie charts and the Word Document are saved in a temporary folder
+    analysis_pipeline.analyse_question(tasks[0]) #loads matplotlib before anything is timed
+    print("{:>5} {:>15} {:>14} {:>12} {:>14}".format("jobs", "sequential (s)", "pipelined (s)", "writing (s)", "analysing (s)"))
+    for jobs in args.jobs:
+        sequential, writing = run(tasks, jobs, False)
+        pipelined, pipelinedWriting = run(tasks, jobs, True)
+        print("{:>5} {:>15.2f} {:>14.2f} {:>12.2f} {:>14.2f}".format(jobs, sequential, pipelined, writing, sequential-writing))
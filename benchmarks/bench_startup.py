@@ -0,0 +1,49 @@
+"""
+Measures the cold-start time of the whole program (a fresh interpreter every run) for each output mode, on a small synthetic survey with and without free response questions
+Also measures how long the heavy libraries that are now only imported when needed take to import on their own
+
+Usage: python benchmarks/bench_startup.py [repeats]
+"""
+#Importing other python libraries
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+import synthetic
+
+PROGRAM = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cs_survey_analysis.py")
+MODES = ("both", "docx", "console", "json")
+
+def coldStart(args, folder, repeats):
+    """
+    Returns the median wall time of running the command in a fresh interpreter
+    """
+    times = [ ]
+    for i in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=folder, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        print("{:>24} {:>10}".format("import", "time (s)"))
+        for library in ("matplotlib.pyplot", "docx", "summariser"):
+            print("{:>24} {:>10.3f}".format(library, coldStart(["-c", "import sys; sys.path.insert(0, {!r}); import {}".format(os.path.dirname(PROGRAM), library)], tmp, repeats)))
+
+        print("\n{:>24} {:>10} {:>10}".format("survey", "output", "time (s)"))
+        for surveyName, freeResponse in (("with free response", 2), ("without free response", 0)):
+            folder = os.path.join(tmp, str(freeResponse))
+            os.mkdir(folder)
+            questions = synthetic.makeQuestions(demographic=2, numeric=4, categorical=2, freeResponse=freeResponse)
+            xlName = synthetic.makeWorkbook(os.path.join(folder, "bench.xlsx"), questions, respondents=200)
+            synthetic.makeConfig(os.path.join(folder, "config.txt"), xlName, questions, docName="bench.docx")
+            for mode in MODES:
+                print("{:>24} {:>10} {:>10.3f}".format(surveyName, mode, coldStart([PROGRAM, "--no-cache", "--no-pie-files", "--output", mode], folder, repeats)))
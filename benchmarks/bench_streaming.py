@@ -0,0 +1,52 @@
+"""
+Compares the peak memory of a full run (every response kept in lists) against a run in streaming mode (rows streamed into counts) as the number of respondents grows
+Each run happens in its own process, so the peak RSS of one run does not affect the other
+
+Usage: python benchmarks/bench_streaming.py [respondents ...]
+"""
+#Importing other python libraries
+import contextlib
+import multiprocessing #runs each analysis in a fresh process
+import os
+import resource #for the peak RSS of a process
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+import synthetic
+
+def measure(folder, configName, streaming, queue):
+    """
+    Runs the whole analysis and puts its wall time and peak RSS (in MB) onto the queue
+    """
+    os.chdir(folder)
+    import cs_survey_analysis
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        cs_survey_analysis.run_survey(configName, savePies=False, streamingMode=streaming, sampleSize=2000)
+    wall = time.perf_counter() - start
+    queue.put((wall, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0)) #ru_maxrss is in kilobytes on Linux
+
+def run(folder, configName, streaming):
+    context = multiprocessing.get_context("spawn") #a fresh interpreter for every measurement
+    queue = context.Queue()
+    process = context.Process(target=measure, args=(folder, configName, streaming, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [2000, 10000, 40000]
+    questions = synthetic.makeQuestions(demographic=2, numeric=6, categorical=3, freeResponse=2)
+    print("{:>12} {:>12} {:>12} {:>14} {:>14}".format("respondents", "full (s)", "stream (s)", "full RSS (MB)", "stream RSS (MB)"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for respondents in sizes:
+            xlName = synthetic.makeWorkbook(os.path.join(tmp, "bench_{}.xlsx".format(respondents)), questions, respondents, numericMax=100)
+            configName = synthetic.makeConfig(os.path.join(tmp, "config_{}.txt".format(respondents)), xlName, questions, docName=os.path.join(tmp, "bench.docx"))
+            fullTime, fullMem = run(tmp, configName, False)
+            streamTime, streamMem = run(tmp, configName, True)
+            print("{:>12} {:>12.2f} {:>12.2f} {:>14.1f} {:>14.1f}".format(respondents, fullTime, streamTime, fullMem, streamMem))
@@ -0,0 +1,132 @@
+"""
+Benchmarks every stage of the analysis on a synthetic survey, and writes the results to a JSON file so that they can be compared between commits
+Each stage is run once to measure its wall time and CPU time, and again (on fresh inputs) with tracemalloc to measure its peak memory
+Everything runs offline: the survey is generated locally, and the summariser only uses the NLTK data that is already installed
+
+Usage: python benchmarks/bench_suite.py --respondents 5000 --output bench.json [--compare old_bench.json]
+"""
+#Importing other python libraries
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc #for the peak memory of each stage
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing my other python files
+import synthetic
+import read_config as rc
+import excel_functions as ex
+import analysis_pipeline
+import output_methods
+from summariser import get_summariser
+
+#Importing other libraries from external sources
+import docx
+
+STAGES = ("readConfig", "openExcel", "build", "plot_pie", "summarize", "docx") #the stages, in the order they run
+
+def run_stages(configName, docName, measure):
+    """
+    Runs every stage of the analysis once on fresh inputs, calling measure(stage, function) to run and measure each stage
+    """
+    get_summariser()._summaries.clear() #so that the summaries from the previous pass are not reused
+    configs = measure("readConfig", lambda: rc.readConfig(configName))
+    xlName, sheetName, _, questions, leaveOut, summLen = configs
+    responses = measure("openExcel", lambda: ex.openExcel(xlName, sheetName, questions))
+    tasks = analysis_pipeline.make_tasks(questions, responses, leaveOut, summLen)
+    qnList = measure("build", lambda: [analysis_pipeline.build_question(*task[:4]) for task in tasks])
+    charted = [question for question in qnList if question.__class__.__name__ in ("NumericQn", "CategoricalQn")]
+    measure("plot_pie", lambda: [question.chart() for question in charted if question.stats().count > 0])
+    summarised = [question for question in qnList if question.__class__.__name__ == "FreeResponseQn"]
+    measure("summarize", lambda: [question.summarize(sentenceNo=summLen, leaveOut=leaveOut) for question in summarised])
+    def writeDocx():
+        analysisDoc = docx.Document()
+        for question in qnList:
+            output_methods.docx_output(question, analysisDoc, exclude=leaveOut, summLen=summLen)
+        analysisDoc.save(docName)
+    measure("docx", writeDocx)
+
+def benchmark(configName, docName):
+    """
+    Returns the wall time, CPU time and peak memory of each stage
+    """
+    results = {stage: { } for stage in STAGES}
+    def timed(stage, function):
+        wallStart, cpuStart = time.perf_counter(), time.process_time()
+        result = function()
+        results[stage]["wall_s"] = time.perf_counter() - wallStart
+        results[stage]["cpu_s"] = time.process_time() - cpuStart
+        return result
+    def traced(stage, function):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        results[stage]["peak_mb"] = (tracemalloc.get_traced_memory()[1] - before)/1024.0/1024.0 #the memory used by the stage at its peak
+        return result
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull): #hides any messages printed by the program
+        run_stages(configName, docName, timed)
+        tracemalloc.start()
+        try:
+            run_stages(configName, docName, traced)
+        finally:
+            tracemalloc.stop()
+    return results
+
+def git_commit():
+    """
+    Returns the current git commit, or None if it cannot be found
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(old, new):
+    """
+    Prints how much each stage has changed since the old results
+    """
+    print("\n{:>12} {:>14} {:>14} {:>10}".format("stage", "old wall (s)", "new wall (s)", "ratio"))
+    for stage in STAGES:
+        oldWall = old["stages"].get(stage, { }).get("wall_s")
+        newWall = new["stages"][stage]["wall_s"]
+        ratio = "{:.2f}x".format(newWall/oldWall) if oldWall else "-"
+        print("{:>12} {:>14} {:>14.3f} {:>10}".format(stage, "{:.3f}".format(oldWall) if oldWall else "-", newWall, ratio))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks every stage of the analysis on a synthetic survey")
+    parser.add_argument("--respondents", type=int, default=2000)
+    parser.add_argument("--demographic", type=int, default=2, help="number of demographic questions")
+    parser.add_argument("--numeric", type=int, default=6, help="number of numeric questions")
+    parser.add_argument("--categorical", type=int, default=3, help="number of categorical questions")
+    parser.add_argument("--free-response", type=int, default=2, help="number of free response questions")
+    parser.add_argument("--numeric-max", type=int, default=5, help="highest possible numeric response")
+    parser.add_argument("--cardinality", type=int, default=3, help="number of choices for categorical questions")
+    parser.add_argument("--text-length", type=int, default=8, help="maximum number of words in a free response")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="JSON file from an earlier run to compare the results against")
+    args = parser.parse_args()
+
+    params = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    questions = synthetic.makeQuestions(args.demographic, args.numeric, args.categorical, args.free_response)
+    with tempfile.TemporaryDirectory() as tmp:
+        xlName = synthetic.makeWorkbook(os.path.join(tmp, "bench.xlsx"), questions, args.respondents, numericMax=args.numeric_max, cardinality=args.cardinality, textLength=args.text_length, seed=args.seed)
+        configName = synthetic.makeConfig(os.path.join(tmp, "config.txt"), xlName, questions, docName=os.path.join(tmp, "bench.docx"))
+        stages = benchmark(configName, os.path.join(tmp, "bench.docx"))
+    results = {"commit": git_commit(), "python": platform.python_version(), "params": params, "stages": stages}
+    with open(args.output, "w") as outputFile:
+        json.dump(results, outputFile, indent=2)
+
+    print("{:>12} {:>10} {:>10} {:>12}".format("stage", "wall (s)", "cpu (s)", "peak (MB)"))
+    for stage in STAGES:
+        print("{:>12} {:>10.3f} {:>10.3f} {:>12.2f}".format(stage, stages[stage]["wall_s"], stages[stage]["cpu_s"], stages[stage]["peak_mb"]))
+    if args.compare:
+        with open(args.compare) as oldFile:
+            compare(json.load(oldFile), results)
@@ -0,0 +1,50 @@
+"""
+Compares summarising every response (the Luhn summariser on the whole column) against summarising only the unique responses, weighted by how often they were given
+Measures the time taken for columns with many repeated responses, and checks that the summary keeps the same sentences (without the repeats)
+
+Usage: python benchmarks/bench_summarise.py [respondents ...]
+"""
+#Importing other python libraries
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #allows me to import the main program's files
+
+#Importing other libraries from external sources
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.luhn import LuhnSummarizer
+
+#Importing my other python files
+from summariser import Summariser, PUNCTUATION
+from synthetic import makeResponse
+
+def summariseAll(summariser, responses, sentenceNo, leaveOut):
+    """
+    Summarises every response, including the repeats, the way the summariser used to
+    """
+    text = "".join(r + ". " for r in (str(r).translate(PUNCTUATION) for r in responses if r is not None) if r.strip().lower() not in leaveOut)
+    luhn = LuhnSummarizer(summariser.luhn._stemmer)
+    luhn.stop_words = summariser.luhn.stop_words
+    return [str(sentence) for sentence in luhn(PlaintextParser.from_string(text, summariser.tokenizer).document, sentenceNo)]
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 10000, 50000]
+    rng = random.Random(0)
+    summariser = Summariser()
+    leaveOut = ["nil", "na", "none", "-"]
+    print("{:>12} {:>8} {:>10} {:>11} {:>8} {:>9}".format("respondents", "unique", "all (s)", "unique (s)", "speedup", "kept"))
+    for respondents in sizes:
+        common = [makeResponse("free-response", rng, textLength=3) for i in range(50)] #short answers that many respondents give
+        responses = [rng.choice(common) if rng.random() < 0.8 else makeResponse("free-response", rng) for i in range(respondents)]
+        responses = [r.lower() if rng.random() < 0.3 else r + "!" if rng.random() < 0.2 else r for r in responses] #near-exact repeats
+        start = time.perf_counter()
+        before = summariseAll(summariser, responses, 5, leaveOut)
+        allTime = time.perf_counter() - start
+        start = time.perf_counter()
+        after = summariser.summarize(responses, 5, leaveOut)
+        uniqueTime = time.perf_counter() - start
+        repeats = set(sentence.lower() for sentence in before)
+        kept = sum(1 for sentence in after if sentence.lower() in repeats) #the sentences of the old summary that are still in the new one (the rest of the new one replaces repeats)
+        print("{:>12} {:>8} {:>10.3f} {:>11.3f} {:>7.1f}x {:>4}/{:<4}".format(respondents, len(summariser.preprocess(responses, leaveOut)), allTime, uniqueTime, allTime/uniqueTime, kept, len(repeats)))
@@ -0,0 +1,91 @@
+#Importing other python libraries
+import csv #for writing the synthetic survey to a CSV file
+import random #for generating random responses
+
+#Importing other libraries from external sources
+import openpyxl #allows me to write the synthetic survey to an Excel spreadsheet
+
+#words used to make up the synthetic free responses
+VOCABULARY = ["learning", "programming", "the", "microbit", "games", "project", "coding", "making", "fun", "lessons",
+              "computer", "teacher", "arrays", "loops", "variables", "creating", "my", "own", "game", "challenges"]
+CATEGORIES = ["Yes", "No", "Maybe", "Not sure", "Definitely", "Never", "Sometimes", "Often"] #choices used for the synthetic categorical questions
+
+def makeQuestions(demographic=4, numeric=6, categorical=2, freeResponse=3):
+    """
+    Returns a dictionary of questions in the same form as readConfig(), with the given number of questions per type
+
+    >>> makeQuestions(1, 2, 1, 1)
+    {'1': 'demographic', '2': 'numeric', '3': 'numeric', '4': 'categorical', '5': 'free-response'}
+    """
+    qnTypes = ["demographic"]*demographic + ["numeric"]*numeric + ["categorical"]*categorical + ["free-response"]*freeResponse
+    return {str(i+1): qnType for i, qnType in enumerate(qnTypes)} #question numbers start from 1, just like in config.txt
+
+def makeResponse(qnType, rng, numericMax=5, cardinality=3, textLength=8):
+    """
+    Returns a random response for a question of the given type
+    """
+    if qnType == "numeric":
+        return rng.randint(1, numericMax)
+    elif qnType == "categorical": #if more choices are needed than there are in CATEGORIES, numbered choices are used
+        choice = rng.randrange(cardinality)
+        return CATEGORIES[choice] if cardinality <= len(CATEGORIES) else "Choice {}".format(choice+1)
+    elif qnType == "free-response":
+        return " ".join(rng.choice(VOCABULARY) for i in range(rng.randint(1, textLength))).capitalize()
+    else:
+        return "Student {}".format(rng.randint(1, 10000))
+
+def makeRows(questions, respondents=1000, numericMax=5, cardinality=3, textLength=8, seed=0):
+    """
+    Gives the question statements, followed by the responses of each respondent
+    The same seed always gives the same responses, so results can be compared between runs
+    """
+    rng = random.Random(seed)
+    yield ["Question {} ({})".format(qnNo, qnType) for qnNo, qnType in questions.items()] #the first row contains the question statements
+    for i in range(respondents):
+        yield [makeResponse(qnType, rng, numericMax, cardinality, textLength) for qnType in questions.values()]
+
+def makeWorkbook(filename, questions, respondents=1000, sheetname="Form responses 1", numericMax=5, cardinality=3, textLength=8, seed=0):
+    """
+    Writes a synthetic survey with the given questions and number of respondents to an Excel file
+    """
+    workbook = openpyxl.Workbook(write_only=True) #write-only mode streams the rows to the file
+    sheet = workbook.create_sheet(sheetname)
+    for row in makeRows(questions, respondents, numericMax, cardinality, textLength, seed):
+        sheet.append(row)
+    workbook.save(filename)
+    return filename
+
+def makeCSV(filename, questions, respondents=1000, numericMax=5, cardinality=3, textLength=8, seed=0):
+    """
+    Writes the same synthetic survey as makeWorkbook() (for the same seed) to a CSV file
+    """
+    with open(filename, "w", encoding="utf-8", newline="") as csvFile:
+        csv.writer(csvFile).writerows(makeRows(questions, respondents, numericMax, cardinality, textLength, seed))
+    return filename
+
+def makeConfig(configName, xlName, questions, docName="synthetic_analysis.docx", sheetname="Form responses 1", leaveOut="nil, na, none, -", summLen=5):
+    """
+    Writes a config file in the same format as config.txt for the synthetic survey
+    """
+    lines = ["Name of Excel file: {}".format(xlName),
+             "Name of Excel sheet: {}".format(sheetname),
+             "",
+             "Words to leave out (for free-response): {}".format(leaveOut),
+             "No. of sentences in summary (for free-response): {}".format(summLen),
+             "",
+             "Name of output Word Document: {}".format(docName),
+             "",
+             "~~~~~~~~~DO NOT EDIT BELOW~~~~~~~~~~",
+             "Format:",
+             "<question no.>: <type of question>",
+             "Types of questions include:",
+             "- demographic (will not be analysed)",
+             "- numeric (e.g. scale, age)",
+             "- categorical (e.g. MCQs)",
+             "- free-response",
+             "~~~~~~~~DO NOT EDIT ABOVE~~~~~~~~~~~",
+             ""]
+    lines += ["{}: {}".format(qnNo, qnType) for qnNo, qnType in questions.items()]
+    with open(configName, "w", encoding="utf-8") as config:
+        config.write("\n".join(lines))
+    return configName
@@ -0,0 +1,109 @@
+#Import other libraries from external sources
+import numpy as np #allows me to count the responses of every group at once
+
+#Import my other python files
+from question_classes import NumericQn, CategoricalQn #python file containing classes for each question type (their encoding and counting functions are reused here)
+
+class GroupIndex:
+    """
+    The group of each respondent, worked out once from one or more demographic columns (e.g. class and gender) and shared by every question
+    The groups are stored dictionary-encoded, just like a CategoricalQn: the labels of the groups (in order), and the code of the group of each respondent
+    """
+    def __init__(self, columns, names):
+        """
+        Builds the index from the responses to each demographic column (arranged in the same order as the respondents) and the names of the columns
+
+        >>> groups = GroupIndex([["3A", "3B", "3A", None]], ["Class"])
+        >>> groups.labels, groups.codes
+        (['(blank)', '3A', '3B'], array([1, 2, 1, 0], dtype=uint8))
+        >>> GroupIndex([["3A", "3B", "3A"], ["F", "M", "M"]], ["Class", "Gender"]).labels
+        ['3A / F', '3A / M', '3B / M']
+        """
+        self.name = " / ".join(str(name) for name in names) #the name of the breakdown, e.g. "Class / Gender"
+        if len(columns) == 1: #the labels are the responses themselves, converted to text so that groups of numbers and text can be arranged in order
+            keys = ["(blank)" if value is None else str(value) for value in columns[0]]
+        else: #the label of the group of each respondent combines their responses to every column
+            keys = [" / ".join("(blank)" if value is None else str(value) for value in row) for row in zip(*columns)]
+        self.labels, self.codes = CategoricalQn._encode(keys)
+
+    def __len__(self):
+        return len(self.labels)
+
+class CrossTab:
+    """
+    The number and percentage of responses per choice for each group, along with the mean and median of each group for numeric questions
+    """
+    def __init__(self, groups, choices, counts, means=None, medians=None):
+        """
+        Initialises the table from the number of responses per choice for each group (one row per group, one column per choice)
+        """
+        self.name = groups.name #the name of the breakdown
+        self.groups = list(groups.labels) #the label of each group (each row)
+        self.choices = list(choices) #the choices (each column)
+        self.counts = counts.tolist() #the number of responses per choice for each group
+        self.totals = counts.sum(axis=1).tolist() #the number of responses from each group
+        self.percent = [[(freq/float(total))*100 if total else 0.0 for freq in row] for row, total in zip(self.counts, self.totals)] #the percentage of each group's responses per choice
+        self.means = means #the mean of each group (numeric questions only)
+        self.medians = medians #the median of each group (numeric questions only)
+
+def cross_tab(groups, qnType, responses, binCount=NumericQn.bins):
+    """
+    Breaks down the responses to a numeric or categorical question by group, going through the responses only once for all the groups
+    responses must be the raw responses, in the same order as the respondents in the group index
+    Numeric questions with more than NumericQn.maxChoices different responses are broken down by the same binCount ranges as their histogram (the means and medians still use every response)
+
+    >>> groups = GroupIndex([["3A", "3B", "3A", "3B"]], ["Class"])
+    >>> table = cross_tab(groups, "categorical", ["Yes", "No", "Yes", "Yes"])
+    >>> table.choices, table.counts, table.percent
+    (['No', 'Yes'], [[0, 2], [1, 1]], [[0.0, 100.0], [50.0, 50.0]])
+    >>> table = cross_tab(groups, "numeric", [4, 2, 5, "x"])
+    >>> table.counts, table.means, table.medians
+    ([[0, 1, 1], [1, 0, 0]], [4.5, 2.0], [4.5, 2])
+    >>> groups = GroupIndex([["3A"]*11 + ["3B"]*11], ["Class"])
+    >>> table = cross_tab(groups, "numeric", list(range(22)), 2)
+    >>> table.choices, table.counts, table.means
+    (['0–10', '11–21'], [[11, 0], [0, 11]], [5.0, 16.0])
+    """
+    groupCount = len(groups)
+    if qnType == "numeric":
+        values, invalidRows = NumericQn._toArray(responses)
+        valid = np.ones(len(responses), dtype=bool)
+        valid[np.asarray(invalidRows, dtype=np.int64)-1] = False #responses that are not numbers are left out, just like in NumericQn
+        codes = groups.codes[valid].astype(np.int64) #the group of each valid response
+        choices, choiceCodes = np.unique(values, return_inverse=True)
+    else:
+        choices, choiceCodes = CategoricalQn._encode(responses)
+        codes = groups.codes.astype(np.int64)
+    choiceCount = len(choices)
+    if qnType == "numeric" and choiceCount > NumericQn.maxChoices: #too many different responses to show one at a time, so they are grouped into the same ranges as the histogram
+        return _binnedCrossTab(groups, codes, values, choices, binCount)
+    counts = np.bincount(codes*choiceCount + choiceCodes, minlength=groupCount*choiceCount).reshape(groupCount, choiceCount) #counts every (group, choice) pair in one pass
+    if qnType != "numeric":
+        return CrossTab(groups, choices, counts)
+    totals = counts.sum(axis=1).tolist()
+    means = [(row @ choices).item()/total if total else None for row, total in zip(counts, totals)] #the mean of each group, from its counts
+    medians = [NumericQn._medianFromCounts(choices, row, total) if total else None for row, total in zip(counts, totals)] #the median of each group, from its counts
+    return CrossTab(groups, choices.tolist(), counts, means, medians)
+
+def _binnedCrossTab(groups, codes, values, choices, binCount):
+    """
+    Breaks down the valid numeric responses (values, with the group code of each one) by group and by range, without counting every choice of every group first
+    The means and medians of the groups are worked out from the responses themselves, sorted by group and then by value
+    """
+    groupCount = len(groups)
+    edges, labels = NumericQn._binEdges(choices, binCount)
+    binCount = len(labels) #there may be fewer ranges than asked for
+    counts = np.bincount(codes*binCount + NumericQn._binCodes(edges, values), minlength=groupCount*binCount).reshape(groupCount, binCount) #counts every (group, range) pair in one pass
+    totals = np.bincount(codes, minlength=groupCount)
+    sums = np.bincount(codes, weights=values, minlength=groupCount)
+    means = [sum/total if total else None for sum, total in zip(sums.tolist(), totals.tolist())] #the mean of each group, from the sum of its responses
+    ordered = values[np.lexsort((values, codes))] #the responses of each group, one group after another, each in order
+    medians = [ ]
+    for start, total in zip((np.cumsum(totals)-totals).tolist(), totals.tolist()):
+        if not total:
+            medians.append(None)
+        elif total%2 == 0: #if there is an even number of responses, the median is the average of the 2 middle responses
+            medians.append((ordered[start+total//2].item()+ordered[start+total//2-1].item())/2.0)
+        else:
+            medians.append(ordered[start+total//2].item())
+    return CrossTab(groups, labels, counts, means, medians)
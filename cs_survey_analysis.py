@@ -1,65 +1,173 @@
 #Importing my other python files
 import read_config as rc #python file to read config.txt. Functions from this file: readConfig(configName="config.txt")
-import excel_functions as ex #python file to read from the required excel sheet. Functions from this file: openExcel(filename, sheetname)
-from question_classes import NumericQn, CategoricalQn, FreeResponseQn, DemographicQn #python file containing classes for each question type, with functions to evaluate them
-import output_methods #python file to output the analysis to the console and a word document. Functions from this file: console_output(question, exclude=[ ], summLen=5) and docx_output(question, doc, exclude=[ ], summLen=5)
+import excel_functions as ex #python file to read from the required excel sheet or CSV file. Functions from this file: openExcel(filename, sheetname, questions=None, groupBy=()), readRows(filename, sheetname, fromRow=0), openCSV(filename, questions=None, chunkSize=CHUNK_SIZE, groupBy=()), readCSVRows(filename, questions=None, fromRow=0, chunkSize=CHUNK_SIZE), openResponses(filename, sheetname, questions=None, groupBy=()) and readResponseRows(filename, sheetname, questions=None, fromRow=0)
+import analysis_pipeline #python file to build and analyse each question, in parallel if required. Functions from this file: build_question(qnNo, qnType, qnStatement, qnResponse), analyse_question(task, cache=None, measured=False, charts=True, groups=None, chunkSize=None, summaryJobs=1, bins=None), make_tasks(questions, responses, leaveOut, summLen), analyse_tasks(tasks, jobs=1, cache=None, measured=False, charts=True, groups=None, chunkSize=None, summaryJobs=1, bins=None) and write_in_order(results, write, queueSize=4, writerContext=contextlib.nullcontext)
+import crosstab #python file to break down the responses by demographic groups
+import incremental #python file to save the counts for each question between runs, so that only new responses have to be read
+from result_cache import ResultCache #python file containing the cache of results for questions that have already been analysed
+from question_classes import NumericQn #python file containing classes for each question type (NumericQn is used for the default number of ranges in a histogram)
+from instrumentation import RunReport #python file to measure the time and memory used by each stage of the run and each question
+import output_methods #python file to output the analysis to the console, a word document or JSON. Functions from this file: console_output(question, exclude=[ ], summLen=5, savePie=True), docx_output(question, doc, exclude=[ ], summLen=5) and json_output(question, exclude=[ ], summLen=5)
 
-#Importing other libraries
-import docx #allows me to write to a Microsoft Word Document
+#Importing other python libraries
+import argparse #allows me to read the options given when running the program
+import contextlib #for contextlib.nullcontext()
+import json #for saving the analysis as JSON
+import os #for os.path.splitext() and os.path.join()
 
-####################
-### Main program ###
-####################
+OUTPUTS = ("both", "console", "docx", "json") #where the analysis can be output to
 
-#reading from the configuration file
-configs = rc.readConfig() #read config.txt. Returns a list containing various information (as listed below)
-                          #simply returns "ERROR" when an error occurs
-if configs != "ERROR": #if configs == "ERROR", do not execute the rest of the program
+def run_survey(configName="config.txt", jobs=1, savePies=True, incrementalMode=False, cache=None, streamingMode=False, sampleSize=20000, report=None, output="both", outputDir=None, groupBy=None, chunkSize=None, summaryJobs=1, bins=None):
+    """
+    Analyses the survey described in the config file, printing the analysis to the console and writing it to the Word Document
+    If jobs is more than 1, the questions are analysed in that many worker processes, but the analysis is still output in the same order as the config file
+    If savePies is False, the pie charts are only added to the Word Document and are not saved as separate PNG files
+    If incrementalMode is True, the counts for each question are saved after the run, and the next run only reads the responses added since then
+    Everything is counted again if the question statements or the questions in the config file have changed
+    If streamingMode is True, the rows are read one at a time and added straight to the counts for each question, so the memory used does not grow with the number of respondents
+    Free response questions are then summarised from a random sample of at most sampleSize responses
+    If chunkSize is given, free response questions are summarised in chunks of that many responses (in summaryJobs worker processes), and the summary is picked from the summaries of the chunks
+    Numeric questions with too many different responses to list are shown as a histogram, with the responses grouped into bins ranges (10 if bins is not given, fewer only if there are fewer whole numbers between the lowest and highest response)
+    If a ResultCache is given, the statistics, pie charts and summaries of questions whose responses have not changed are taken from it instead of being worked out again
+    If a RunReport is given, the time and memory used by each stage and each question are measured, and saved as a JSON report next to the Word Document
+    If outputDir is given, the Word Document (and any other files saved next to it) is saved in that folder instead of the current one
+    If groupBy (a list of question numbers) is given, the numeric and categorical questions are also broken down by the responses to those (demographic) questions
+    Returns the name of the Word Document, or "ERROR" if the survey could not be analysed
+    output chooses where the analysis goes: "both" (the console and the Word Document), "console" (without drawing any pie charts), "docx" (only the Word Document) or "json" (a JSON file next to the Word Document, without drawing any pie charts)
+    """
+    stage = report.stage if report is not None else lambda name: contextlib.nullcontext() #nothing is measured without a report
+    #reading from the configuration file
+    with stage("readConfig"):
+        configs = rc.readConfig(configName) #read config.txt. Returns a list containing various information (as listed below)
+                                        #simply returns "ERROR" when an error occurs
+    if configs == "ERROR": #if configs == "ERROR", do not execute the rest of the program
+        return "ERROR"
     #elements of the configuration file
     xlName = configs[0] #first element: the name of the Excel file containing the desired sheet
     sheetName = configs[1] #second element: the name of the Excel sheet to read the data from
     docName = configs[2] #third element: the name of the Word Document to save the analysis from
+    if outputDir is not None:
+        docName = os.path.join(outputDir, os.path.basename(docName))
     questions = configs[3] #fourth element: a dictionary with the details of each question
                            #each question is arranged as <question no.>: <question type>
     leaveOut = configs[4] #fifth element: a list of words (strings) to leave out from the summary
     summLen = configs[5] #sixth element: the number of sentences to be included in the summary
+    groupBy = list(groupBy or [ ]) #the questions to break down the other questions by
+    for qnNo in groupBy:
+        if qnNo not in questions:
+            print("Error: Q{} (to break down the questions by) is not in {}".format(qnNo, configName))
+            return "ERROR"
 
     #opening the files
-    responses = ex.openExcel(xlName, sheetName) #reads from the desired excel sheet. Returns a 2D list containing the responses for each question
+    groups = None #the group of each respondent, worked out once and shared by every question
+    with stage("read"):
+        if incrementalMode or streamingMode: #the rows are streamed once into the counts for each question, instead of keeping every response in memory
+            state = None
+            if incrementalMode:
+                stateName = incremental.state_name(docName) #the file containing the counts saved by the previous run
+                state = incremental.load_state(stateName, xlName, sheetName, questions, sampleSize if streamingMode else None) #returns None if there is no saved state, or if it was made with a different config file or sample size
+            fromRow = state["watermark"] if state is not None else 0 #the responses counted in the previous run are skipped
+            sheetRows = ex.readResponseRows(xlName, sheetName, questions, fromRow) #the question statements, and a generator for the rows of the new respondents
+            if sheetRows != "ERROR" and state is not None and tuple(sheetRows[0]) != state["header"]: #the question statements have changed, so everything is counted again
+                state = None
+                sheetRows = ex.readResponseRows(xlName, sheetName, questions)
+            if sheetRows == "ERROR": #if sheetRows == "ERROR", do not execute the rest of the program
+                return "ERROR"
+            if state is None:
+                state = incremental.new_state(xlName, sheetName, questions, sampleSize if streamingMode else None) #in streaming mode, only a sample of each free response question is kept
+            try:
+                incremental.update_state(state, *sheetRows) #adds the new responses to the counts
+            except ex.ReadError: #the error has already been printed
+                return "ERROR"
+            tasks = incremental.make_tasks(state, leaveOut, summLen) #the questions are built from the counts instead of the responses
+        else:
+            responses = ex.openResponses(xlName, sheetName, questions, groupBy=groupBy) #reads from the desired excel sheet (or CSV file). Returns a 2D list containing the responses for each question
+                                                                   #only the questions in config.txt are read, and the responses to demographic questions are skipped (unless the questions are broken down by them)
+            if responses == "ERROR": #if responses == "ERROR", do not execute the rest of the program
+                return "ERROR"
+            tasks = analysis_pipeline.make_tasks(questions, responses, leaveOut, summLen)
+            if groupBy:
+                qnNos = list(questions)
+                groups = crosstab.GroupIndex([responses[qnNos.index(qnNo)][1:] for qnNo in groupBy], [responses[qnNos.index(qnNo)][0] for qnNo in groupBy])
+    toConsole = output in ("both", "console") #whether the analysis is printed to the console
+    toDocx = output in ("both", "docx") #whether the analysis is written to the Word Document (the pie charts are only drawn if it is)
+    if toDocx:
+        import docx #allows me to write to a Microsoft Word Document (only imported when a Word Document is written, since it takes a while to import)
+        analysisDoc = docx.Document() #opens the Word Document to output the analysis in. Returns the name of the document
+    results = [ ] #the analysis of each question, for the JSON output
 
-if configs != "ERROR" and responses != "ERROR": #if configs == "ERROR" or responses == "ERROR", do not execute the rest of the program
-    #opening the files (cont'd)
-    analysisDoc = docx.Document() #opens the Word Document to output the analysis in. Returns the name of the document
-    
     #outputting the title
     print("Analysis of {} (from {})".format(sheetName, xlName)) #printing the title to the console
-    docTitle = analysisDoc.add_heading("Analysis of {}\n(from {})".format(sheetName, xlName), 0) #writing the title to the Word Document
-    
+    if toDocx:
+        docTitle = analysisDoc.add_heading("Analysis of {}\n(from {})".format(sheetName, xlName), 0) #writing the title to the Word Document
+
     #evaluation of the questions and outputting the analysis
-    qnCount = 0 #keeps count of the questions (so that the relevant response list can be obtained)
+    def write(currQn, printed, analysed):
+        """
+        Outputs the analysis of one question (in the writer thread if the next questions are analysed in worker processes at the same time)
+        """
+        print(printed, end="") #prints any messages from analysing the question (e.g. invalid responses)
+        with (report.question(currQn, analysed) if report is not None else contextlib.nullcontext()): #measures the output of the question
+            if toConsole:
+                output_methods.console_output(currQn, exclude=leaveOut, summLen=summLen, savePie=savePies and toDocx) #print the analysis of the question to the console
+            if toDocx:
+                output_methods.docx_output(currQn, analysisDoc, exclude=leaveOut, summLen=summLen) #write the analysis of the question to the Word Document
+            if output == "json":
+                results.append(output_methods.json_output(currQn, exclude=leaveOut, summLen=summLen))
+    with stage("analyse"):
+        analysed = analysis_pipeline.analyse_tasks(tasks, jobs, cache, measured=report is not None, charts=toDocx, groups=groups, chunkSize=chunkSize, summaryJobs=summaryJobs, bins=bins) #the questions come back in the same order as the config file, with their statistics, pie charts and summaries already worked out
+        if jobs > 1: #a single writer thread outputs each question in order, while the worker processes analyse the next ones
+            analysis_pipeline.write_in_order(analysed, write, writerContext=report.thread if report is not None else contextlib.nullcontext)
+        else: #with only the main thread analysing, a writer thread would just take turns with it, so each question is output as soon as it is analysed
+            for result in analysed:
+                write(*result)
 
-    for qnNo, qnType in questions.items(): #iterates through the dictionary of questions (containing the question number and the type of question)
-        qnResponse = responses[qnCount] #gets the relevent response list for the question (containing the question statement and the list of responses)
-        qnStatement = qnResponse[0] #retrieving the question statement from the response list (since the question statement for each question is in row A of the excel sheet)
-        del qnResponse[0] #delete the question statement from the response list to get a list purely with the responses for the questions
-        #setting the required question class
-        if qnType == "numeric":
-            try:
-                currQn = NumericQn(qnNo, qnStatement, qnResponse)
-            except TypeError:
-                break
-        elif qnType == "categorical": 
-            currQn = CategoricalQn(qnNo, qnStatement, qnResponse)
-        elif qnType == "free-response":
-            currQn = FreeResponseQn(qnNo, qnStatement, qnResponse)
-        else:
-            currQn = DemographicQn(qnNo, qnStatement)
-        output_methods.console_output(currQn, exclude=leaveOut, summLen=summLen) #print the analysis of the question to the console
-        output_methods.docx_output(currQn, analysisDoc, exclude=leaveOut, summLen=summLen) #write the analysis of the question to the Word Document
-        qnCount += 1 #update the question count
+    #saving the Word Document (or the JSON file)
+    with stage("save"):
+        if toDocx:
+            analysisDoc.save(docName) #saves the word document according to the required name
+        elif output == "json":
+            jsonName = os.path.splitext(docName)[0] + ".json" #the JSON file is named after the Word Document
+            with open(jsonName, "w", encoding="utf-8") as jsonFile:
+                json.dump({"sheet": sheetName, "excel": xlName, "questions": results}, jsonFile, indent=2, ensure_ascii=False, default=str) #default=str saves responses such as dates as text
+            print("\nAnalysis saved to: {}".format(jsonName))
+    if incrementalMode:
+        incremental.save_state(stateName, state) #saves the counts for the next run, only after the analysis has been saved
+    if report is not None:
+        report.save(docName, config=configName, excel=xlName, sheet=sheetName, jobs=jobs, incremental=incrementalMode, streaming=streamingMode, cache=cache is not None, output=output, chunkSize=chunkSize, bins=bins) #saves the report next to the Word Document
+    return docName
+
+####################
+### Main program ###
+####################
 
-    #saving the Word Document
-    analysisDoc.save(docName) #saves the word document according to the required name
+if __name__ == "__main__": #the worker processes import this file too, so the program only runs when this file is run directly
+    parser = argparse.ArgumentParser(description="Analyses the survey responses according to config.txt")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes used to analyse the questions (default: 1)")
+    parser.add_argument("--no-pie-files", dest="savePies", action="store_false", help="do not save the pie charts as separate PNG files (they are still added to the Word Document)")
+    parser.add_argument("--incremental", action="store_true", help="save the counts for each question, so that the next run only reads the new responses")
+    parser.add_argument("--cache-dir", default=".survey_cache", help="folder to save the results of each question in, so that unchanged questions are not analysed again (default: .survey_cache)")
+    parser.add_argument("--cache-size", type=float, default=200, help="maximum size of the cache folder in MB, after which the results used least recently are deleted (default: 200)")
+    parser.add_argument("--no-cache", action="store_true", help="analyse every question again, without reading or writing the cache")
+    parser.add_argument("--streaming", action="store_true", help="read the responses one row at a time into counts for each question, so that very large sheets use a fixed amount of memory")
+    parser.add_argument("--sample-size", type=int, default=20000, help="in streaming mode, the number of responses sampled for each free response question (default: 20000)")
+    parser.add_argument("--report", action="store_true", help="measure the time and memory used by each stage and question, and save them as a JSON report next to the Word Document")
+    parser.add_argument("--profile", action="store_true", help="also profile each stage with cProfile and save the profile next to the Word Document (implies --report)")
+    parser.add_argument("--output", choices=OUTPUTS, default="both", help="where to output the analysis: both (the console and the Word Document), console, docx or json (a JSON file next to the Word Document). Pie charts are only drawn for both and docx (default: both)")
+    parser.add_argument("--group-by", type=lambda text: [qnNo.strip() for qnNo in text.split(",")], help="question numbers of demographic questions (separated by commas, e.g. 1,2) to break down the numeric and categorical questions by (cannot be used with --incremental or --streaming)")
+    parser.add_argument("--chunk-size", type=int, help="summarise free response questions in chunks of this many responses, then summarise the summaries of the chunks, so that large questions take less time and memory (default: every response at once)")
+    parser.add_argument("--summary-jobs", type=int, default=1, help="with --chunk-size, the number of worker processes that summarise the chunks of each question (default: 1)")
+    parser.add_argument("--bins", type=int, help="the number of ranges that numeric questions with more than {} different responses are grouped into, shown as a histogram and used to break them down by group (default: {})".format(NumericQn.maxChoices, NumericQn.bins))
+    args = parser.parse_args()
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.bins is not None and args.bins < 1:
+        parser.error("--bins must be at least 1")
+    if args.group_by and (args.incremental or args.streaming):
+        parser.error("--group-by cannot be used with --incremental or --streaming, since the responses are only kept as counts")
+    cache = None if args.no_cache else ResultCache(args.cache_dir, int(args.cache_size*1024*1024))
+    report = RunReport(profile=args.profile) if args.report or args.profile else None
+    run_survey(jobs=args.jobs, savePies=args.savePies, incrementalMode=args.incremental, cache=cache, streamingMode=args.streaming, sampleSize=args.sample_size, report=report, output=args.output, groupBy=args.group_by, chunkSize=args.chunk_size, summaryJobs=args.summary_jobs, bins=args.bins)
 
-print("\n------------------\n")
-print("Program ending...") #tells the user that the program is ending. Prints regardless if an error has occurred
+    print("\n------------------\n")
+    print("Program ending...") #tells the user that the program is ending. Prints regardless if an error has occurred
@@ -1,10 +1,25 @@
+#Importing other python libraries
+import csv #allows me to read from a CSV file
+import itertools #for itertools.islice()
+import math #for math.isfinite()
+
 #Importing other libraries
 import openpyxl #allows me to read from an Excel spreadsheet
 
-def openExcel(filename, sheetname):
+CHUNK_SIZE = 5000 #the number of rows of a CSV file converted at a time
+
+class ReadError(Exception):
+    """
+    Raised when the rows being streamed from a file can no longer be read (the error has already been printed)
+    """
+
+def openExcel(filename, sheetname, questions=None, groupBy=()):
     """
     Reads the responses from the allocated excel sheet
     Returns a 2D list containing the responses for each question
+    The sheet is streamed row by row in read-only mode, so the whole sheet is never loaded into memory at once
+    If the dictionary of questions from readConfig() is given, only the columns listed in it are returned, and demographic columns only keep their question statement (their responses are never read)
+    The responses to the demographic questions in groupBy (a list of question numbers) are read as well, so that the other questions can be broken down by them
 
     >>> openExcel("responses_testing.xlsx", "Form responses 1")
     [['Your Name', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden', 'Hidden'], ['I would like to own a Microbit set for my own learning', 4, 4, 5, 1, 2, 2, 5, 5, 3, 5, 5, 5, 5, 5, 5, 3, 4, 5, 5, 3, 4, 5, 3, 4, 1, 5, 5, 4, 4, 3, 5, 4, 3, 2, 4, 5, 4, 3, 5, 2, 1, 2, 5, 4, 5, 5, 4, 4, 5, 2, 4, 3, 4, 4, 4, 3, 2, 2, 4, 5, 5, 3, 5, 3, 1, 4, 1, 5, 4, 5, 5, 5, 5, 3, 4, 3, 3, 4, 3, 3, 5, 5, 3, 3, 3, 5, 1, 3, 3, 5, 4, 5, 5, 5, 3, 5, 5, 5, 3, 5, 5, 5, 4, 2, 4, 5, 5, 2, 5, 3, 5, 3, 3, 5, 4, 5, 2, 4, 5, 5, 4, 4, 4, 5, 5, 2, 3, 4, 3, 1, 3, 2, 5, 5, 2, 5, 3, 4, 4, 5, 4, 3, 4, 5, 5, 1, 3, 3, 5, 5, 5, 5, 3, 2, 3, 3, 3, 3, 5, 3, 3, 3, 2, 2, 5, 5, 5, 5, 1, 3, 3, 3, 4, 5, 5, 5, 4, 4, 4, 2, 5, 5, 4, 5, 5, 5, 5, 5, 5, 4, 3, 5, 3, 4, 3, 5, 5, 3, 5, 3, 5], ['I would consider using Microbit for my future school projects ', 'Maybe', 'Yes', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'No', 'No', 'Yes', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'No', 'Maybe', 'Yes', 'Yes', 'Maybe', 'Yes', 'No', 'Yes', 'Yes', 'Yes', 'No', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Yes', 'Yes', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Maybe', 'No', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'No', 'Yes', 'Maybe', 'Maybe', 'No', 'Maybe', 'Yes', 'Yes', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'No', 'Maybe', 'No', 'Yes', 'Yes', 'No', 'Yes', 'Yes', 'Yes', 'No', 'Maybe', 'No', 'Maybe', 'Yes', 'Yes', 'Yes', 'No', 'Maybe', 'Yes', 'Yes', 'Maybe', 'Yes', 'Yes', 'Maybe', 'No', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'No', 'Maybe', 'No', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'No', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Yes', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Maybe', 'Yes', 'Maybe', 'Yes', 'Maybe', 'Maybe', 'Maybe', 'Yes'], ['What was your favourite part of the course?', 'shooting game', 'Learning about the shooting game', 'Everything', 'Learning how to use the game block.', 'The games! :PPP', 'Everything.', 'Programming', 'The coding', 'The use of the microbit to play the game I created.', 'The project ', 'trying to code the microbit', 'Programming the microbit', 'the prentation', 'Programming the shooting game', 'Our projects', 'When we were working on projects.', 'The creation of the flappy bird code', 'The computer', 'Programming', 'Coding and decryption (Radio)', 'Probably everything', 'NIL', 'The project', 'Learning new techinal skills', 'Using the computer', 'Individual project', 'Learning about different aspects of programming', 'Learning how to code new games.', 'The Project', 'The decoding lesson', 'getting to know how to code complicated codes', 'Experimenting with the codes.', 'Trying to learn to write Javascript through the blocks system', 'My favourite part of the course was doing the caesar decoder as it was quite challenging and made me think about my code.', 'Making games', 'Learning how to make games on microbit', 'the programming', 'Learning how to program games using microbit', 'I enjoy making games, such as flappy bird throughout the course. I also enjoy the  process of learning different functions, such as array, something I did not learn in Scratch.', 'Learning about making games', 'The project making', 'Making games.', 'making the games', 'The microbit assignment at the end of the module', 'Creation of the games', 'When i was working on the final microbit project', '-', 'The challenges the teacher assigned.', 'making a game\n', 'making games', 'The microbit tryouts', 'the part where it ended', 'Being able to learn how to successfully program a microbit gives a sense of accomplishment.', 'learning about different coding blocks', 'The assignment', 'The Individual Microbit Project', 'Variables', 'Programming', 'The project', 'Creating the bullet game for the assignment (summative)', 'making games', 'ceaser cypher', 'getting to code ', 'Loops and Logic', 'When we were allowed to use the computers', 'The programming and trial and error part of the coding that was fun and exciting.', 'Everything', 'when we learnt the game for fighting and shooting aliens ', 'The individual assignment', 'I like building games', 'na', 'It was fun and enjoyable, the activities we did with the micro-bit was very interactive and fun.', 'Programming games on the Microbit', 'When we tried to decode a message.', 'THE PART WHEN WE START PROGRAMMING', 'Making fun programs with microbit.', 'Posting a YouTube video', 'Caesar Cipher', 'Getting to programme.', 'making a game', 'Creating the Flappy Bird Game', 'getting points', '\n   Learning how to programme games', 'The summative when creating your own game or code', 'The fun activities.', 'programming', 'Lessons', 'Making the code for the game', 'Programming the shooting game', 'Learning about microbits', 'The find the boat thing', 'Trying my hands on coding the microbit!', 'bonus raw marks for homework', 'The part where we had to decipher the code', 'Learning to code', 'learning microbit', 'the teacher', 'nill', 'the part when we can watch utube', 'The video', 'Playing Games', 'The project', 'the last few weeks because we got to use our creativity to combine everything we learnt.', 'Programming the game at the end of the course', 'hands-on tasks', 'Group work/games', 'The last few lessons were less stressful because there were more time to do our projects. ', 'Learning how to make games.', 'Learning and using arrays', 'Learning about variables', 'Programming', 'Using the computers to play games on the sly.', 'actually using the micro bit\n', 'The challenges', 'creating game codes', 'the project', 'Learning about coding', 'Learning to code', 'Creating new projects with microbit', 'The making game part.', 'My favourite part of the course was when i got to experiment for myself using microbit.org to make my own codes.', 'creating games', 'The creating of games on microbit.', 'Playing the games that is coded on the microbit.', 'The Project and the last lesson.', 'using computers', 'Seeing my codes work', 'The favourite part of the course was the flappy bird. ', 'Using the microbit simulator', 'The part before we learnt about Microbit', 'The final project', 'Coding Project!', 'Using an actual Microbit', 'learning to code', 'Learning how to code Flappy Bird.', 'Creating games', 'Being able to think of new solutions to the same problem', 'idk', 'Learning about variables', 'Individual project', 'Coding complicated games.', 'I like the lesson when we get to use the microbit.', 'My favourite part of the course was solving the challenge homework questions (e.g. Card games and AI) which really stretched my coding skills further and put it into perspective for me as a fun and useful part of our daily lives. Similarly, the process of coding my own games and programs allowed me to learn about troubleshooting.', 'Learning how to use Microbit together with programs.', 'Coding games and removing bugs in the coding', 'watching the video', 'learning how to code games', 'Own project', 'The blackjack and using knowledge to create your own games!', 'Learning how to code games.', 'Creating new programmes', 'The project - coding was very enjoyable', 'The hands on activities', 'Hardware', 'Programming the last assignment', 'The lessons', 'Hardware', 'Programming games and using the tinker kits', 'Learning about several coding parts in Microbit (arrays, loops), learning about things like algorithms', 'When I could present solutions which were practical and understandable ', 'solving the problems and doing the assignments at home. ', 'The lessons', 'Learning how to make games.', 'Working with the computers to programme games', 'It was the project part because you can create any game you want.', 'Being able to see my end project', 'Learning how to make games', 'Making my own game', 'The video', 'Logic', 'Exploring the set', 'Making my own game', 'Videos', 'Final project, multiplayer game with Putra', 'Playing with Microbit set', 'Everything', 'Homework assignments where we are given a problem to be solved with the use of a microbit, which we must solve.', 'we tried out many different use of microbits to solve out daily problems', 'programming games', 'learning to code games', 'Learning the different uses of the codes', 'Doing multiplayer projects w/ Yu Chen', 'Learning about the use for different programming functions', 'Learning about how to program using Javascript, although I did not learn much.', 'The video on algorhithms', 'Using the microbit', 'Using microbit.', 'Learning to code', 'Using the microbit', 'Coding programmes and games we want', 'Microbit', 'Using microbit', 'Using the actual microbit ', 'The bonus marks', 'The making of the project ', 'Programming!', 'Using the physical Microbit', 'I like the teacher', 'Coding', 'Coding games', 'Microbit']]
@@ -16,22 +31,190 @@ def openExcel(filename, sheetname):
     'ERROR'
     """
     try:
-        workbook = openpyxl.load_workbook(filename) #opens the required Excel file
+        workbook = openpyxl.load_workbook(filename, read_only=True) #opens the required Excel file in read-only mode, which streams the rows instead of loading every cell at once
     except:
         print("Error: {} not found".format(filename))
         return "ERROR"
     if sheetname in workbook.sheetnames:
         sheet = workbook[sheetname] #opens the required Excel spreadsheet
     else:
+        workbook.close()
         print("Error: '{}' not found in {}".format(sheetname, filename))
         return "ERROR"
-    sheetList = [ ] #initialises the output 2D array
-    columnCount = 0 #keeps count of the current column being read (the question whose responses are currently read)
-    for column in list(sheet.columns): #iterates through the columns (questions)
-        sheetList.append([ ]) #adds a list to store all the responses for the question
-        for cell in list(column): #iterates through each response for the current question
-            sheetList[columnCount].append(cell.value) #stores each response to the list for the current question
-        columnCount += 1 #updates the column (question) count
+    header = next(sheet.iter_rows(max_row=1, values_only=True), ()) #the first row contains the question statements
+    rows = sheet.iter_rows(min_row=2, values_only=True) #iterates through the rows of the respondents, giving only the value of each cell
+    if questions is None: #if no questions are given, every column in the sheet is read
+        qnTypes = [None]*len(header)
+    else:
+        qnTypes = list(questions.values()) #the question types, arranged in the same order as the columns
+    columnCount = len(qnTypes) #the number of columns (questions) to return
+    header = tuple(header) + (None,)*(columnCount-len(header)) #pads the header in case the sheet has fewer columns than the config file
+    sheetList = [[header[i]] for i in range(columnCount)] #initialises the output 2D array with the question statement of each column
+    readColumns = [(i, sheetList[i]) for i in range(columnCount) if qnTypes[i] != "demographic" or _qnNo(questions, i) in groupBy] #the columns whose responses are needed (other demographic columns are skipped entirely)
+    for row in rows: #iterates through each respondent
+        if len(row) < columnCount: #pads the row in case the trailing cells are missing
+            row = tuple(row) + (None,)*(columnCount-len(row))
+        for i, column in readColumns: #stores the response to each required question in the list for that question
+            column.append(row[i])
+    workbook.close() #read-only workbooks keep the file open until they are closed
+    return sheetList #returns the 2D array containing all the responses
+def readRows(filename, sheetname, fromRow=0):
+    """
+    Streams the rows of the allocated excel sheet, one respondent at a time, so that the responses never have to be kept in memory all at once
+    Returns the question statements (from the first row) and a generator that gives the responses of each respondent, skipping the first fromRow respondents
+    The workbook is closed once all the rows have been read
+    """
+    try:
+        workbook = openpyxl.load_workbook(filename, read_only=True) #opens the required Excel file in read-only mode
+    except:
+        print("Error: {} not found".format(filename))
+        return "ERROR"
+    if sheetname not in workbook.sheetnames:
+        workbook.close()
+        print("Error: '{}' not found in {}".format(sheetname, filename))
+        return "ERROR"
+    sheet = workbook[sheetname] #opens the required Excel spreadsheet
+    header = next(sheet.iter_rows(max_row=1, values_only=True), ()) #the first row contains the question statements
+    def rows():
+        try:
+            yield from sheet.iter_rows(min_row=fromRow+2, values_only=True)
+        finally:
+            workbook.close() #read-only workbooks keep the file open until they are closed
+    return header, rows()
+def openResponses(filename, sheetname, questions=None, groupBy=()):
+    """
+    Reads the responses from a CSV file or an Excel sheet, depending on the type of file (the sheet name is not used for CSV files)
+    Returns a 2D list containing the responses for each question, in the same form as openExcel()
+    """
+    if filename.lower().endswith(".csv"):
+        return openCSV(filename, questions, groupBy=groupBy)
+    return openExcel(filename, sheetname, questions, groupBy)
+def readResponseRows(filename, sheetname, questions=None, fromRow=0):
+    """
+    Streams the rows of a CSV file or an Excel sheet, depending on the type of file (the sheet name is not used for CSV files)
+    Returns the question statements and a generator that gives the responses of each respondent, in the same form as readRows()
+    """
+    if filename.lower().endswith(".csv"):
+        return readCSVRows(filename, questions, fromRow)
+    return readRows(filename, sheetname, fromRow)
+def openCSV(filename, questions=None, chunkSize=CHUNK_SIZE, groupBy=()):
+    """
+    Reads the responses from a CSV file (e.g. exported from Google Forms)
+    Returns a 2D list containing the responses for each question, in the same form as openExcel()
+    The rows are read and converted chunkSize rows at a time, so that each column is converted in one go
+    Responses to numeric and categorical questions are converted to numbers where possible and empty cells (and blank lines) become None, just like the values of the cells in an Excel sheet
+    The responses to the demographic questions in groupBy are read as well, just like in openExcel()
+
+    >>> openCSV("hello.csv")
+    Error: hello.csv not found
+    'ERROR'
+    """
+    try:
+        csvFile = open(filename, "r", encoding="utf-8-sig", newline="") #utf-8-sig skips the byte order mark that some programs add to the start of the file
+    except OSError:
+        print("Error: {} not found".format(filename))
+        return "ERROR"
+    with csvFile:
+        try:
+            rows = csv.reader(csvFile)
+            header = next(rows, [ ]) #the first row contains the question statements
+            qnTypes = [None]*len(header) if questions is None else list(questions.values()) #the question types, arranged in the same order as the columns
+            columnCount = len(qnTypes) #the number of columns (questions) to return
+            header = tuple(header) + (None,)*(columnCount-len(header)) #pads the header in case the file has fewer columns than the config file
+            sheetList = [[header[i]] for i in range(columnCount)] #initialises the output 2D array with the question statement of each column
+            readColumns = [(i, qnTypes[i], sheetList[i]) for i in range(columnCount) if qnTypes[i] != "demographic" or _qnNo(questions, i) in groupBy] #the columns whose responses are needed (other demographic columns are skipped entirely)
+            for chunk in _chunks(rows, columnCount, 0, chunkSize):
+                for i, qnType, column in readColumns: #converts the responses to each required question a whole column at a time
+                    column.extend(_convertColumn([row[i] for row in chunk], qnType))
+        except (csv.Error, UnicodeDecodeError) as error:
+            print("Error: {} could not be read ({})".format(filename, error))
+            return "ERROR"
     return sheetList #returns the 2D array containing all the responses
+def readCSVRows(filename, questions=None, fromRow=0, chunkSize=CHUNK_SIZE):
+    """
+    Streams the rows of a CSV file, one respondent at a time, in the same form as readRows()
+    The rows are converted chunkSize rows at a time (just like openCSV()), so only one chunk is kept in memory
+    Blank lines are given as rows of empty cells, so that fromRow counts the lines of the file in the same way as the rows of an Excel sheet
+    If the file cannot be read part way through, the error is printed and a ReadError is raised
 
+    >>> readCSVRows("hello.csv")
+    Error: hello.csv not found
+    'ERROR'
+    """
+    try:
+        csvFile = open(filename, "r", encoding="utf-8-sig", newline="")
+    except OSError:
+        print("Error: {} not found".format(filename))
+        return "ERROR"
+    rows = csv.reader(csvFile)
+    try:
+        header = next(rows, [ ]) #the first row contains the question statements
+    except (csv.Error, UnicodeDecodeError) as error:
+        csvFile.close()
+        print("Error: {} could not be read ({})".format(filename, error))
+        return "ERROR"
+    qnTypes = [None]*len(header) if questions is None else list(questions.values())
+    def convertedRows():
+        try:
+            for chunk in _chunks(rows, len(qnTypes), fromRow, chunkSize):
+                columns = [_convertColumn([row[i] for row in chunk], qnType) if qnType != "demographic" else [row[i] or None for row in chunk] for i, qnType in enumerate(qnTypes)] #demographic responses are not converted, since they are never counted
+                yield from zip(*columns)
+        except (csv.Error, UnicodeDecodeError) as error:
+            print("Error: {} could not be read ({})".format(filename, error))
+            raise ReadError(filename) from error
+        finally:
+            csvFile.close()
+    return header, convertedRows()
+def _qnNo(questions, i):
+    """
+    Returns the question number of the ith column, or None if no questions were given
+    """
+    return None if questions is None else list(questions)[i]
+def _chunks(rows, columnCount, fromRow, chunkSize):
+    """
+    Skips the first fromRow lines, and then gives the remaining rows chunkSize lines at a time, padded to columnCount columns
+    Blank lines are given as rows of empty cells, just like the empty rows of an Excel sheet
+
+    >>> list(_chunks(iter([["t", "1"], [ ], [ ], ["t", "2"], ["t"]]), 2, 1, 2))
+    [[['', ''], ['', '']], [['t', '2'], ['t', '']]]
+    >>> list(_chunks(iter([["t", "1"], [ ], ["t", "2"]]), 2, 0, 2))
+    [[['t', '1'], ['', '']], [['t', '2']]]
+    """
+    rows = itertools.islice(rows, fromRow, None)
+    while True:
+        chunk = [row + [""]*(columnCount-len(row)) for row in itertools.islice(rows, chunkSize)] #pads the row in case the trailing cells are missing
+        if not chunk: #every line has been read
+            return
+        yield chunk
+def _convertColumn(texts, qnType):
+    """
+    Converts a column of text from a CSV file to the values an Excel sheet would give for the type of question
+    Each distinct response is only converted once
 
+    >>> _convertColumn(["4", " 5", "", "4", "x"], "numeric")
+    [4, 5, None, 4, 'x']
+    >>> _convertColumn(["Yes", "", "Maybe"], "free-response")
+    ['Yes', None, 'Maybe']
+    """
+    if qnType in ("numeric", "categorical"):
+        converted = {text: _toNumber(text) for text in set(texts)}
+        return [converted[text] for text in texts]
+    return [text if text else None for text in texts]
+def _toNumber(text):
+    """
+    Converts a cell from a CSV file to a number if it is one, to None if it is empty, and otherwise leaves it as text
+
+    >>> [_toNumber(text) for text in ["4", "-2", "4.5", "", "nan", "Maybe"]]
+    [4, -2, 4.5, None, 'nan', 'Maybe']
+    """
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return number if math.isfinite(number) else text
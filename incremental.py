@@ -0,0 +1,70 @@
+#Import other python libraries
+import os #for os.path.splitext() and os.replace()
+import pickle #allows me to save the state between runs (pickle keeps the exact types of the responses, e.g. numbers, text and dates)
+
+#Import my other python files
+import accumulators #python file containing the counts kept between runs
+
+STATE_VERSION = 4 #changed whenever the layout of the state changes, so that old state files are not used
+
+def state_name(docName):
+    """
+    Returns the name of the file the state is saved to, based on the name of the Word document
+
+    >>> state_name("response_analysis.docx")
+    'response_analysis_state.pkl'
+    """
+    return os.path.splitext(docName)[0] + "_state.pkl"
+
+def load_state(stateName, xlName, sheetName, questions, sampleSize=None):
+    """
+    Returns the state saved by the previous run, or None if there is no saved state or it cannot be used
+    The state cannot be used if it was made from a different Excel sheet, with different questions in the config file, or with a different sample size (see new_state()), since the responses it left out cannot be counted again
+    """
+    try:
+        with open(stateName, "rb") as stateFile:
+            state = pickle.load(stateFile)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return None
+    if state["source"] != (os.path.abspath(xlName), sheetName) or state["questions"] != questions or state["sampleSize"] != sampleSize:
+        return None
+    return state
+
+def save_state(stateName, state):
+    """
+    Saves the state for the next run
+    The state is written to a temporary file first, so that a crash halfway through does not leave a broken state file behind
+    """
+    with open(stateName + ".tmp", "wb") as stateFile:
+        pickle.dump(state, stateFile)
+    os.replace(stateName + ".tmp", stateName)
+
+def new_state(xlName, sheetName, questions, sampleSize=None):
+    """
+    Returns an empty state, with no responses counted yet
+    If sampleSize is given, only a sample of that many responses is kept for each free response question
+    """
+    return {"version": STATE_VERSION,
+            "source": (os.path.abspath(xlName), sheetName), #the Excel sheet the responses come from
+            "questions": dict(questions), #the questions in the config file
+            "sampleSize": sampleSize, #the number of responses kept for each free response question (None if every response is kept)
+            "header": None, #the question statements in the first row of the sheet
+            "watermark": 0, #the number of rows (after the question statements) whose responses have been counted
+            "counts": accumulators.new_accumulators(questions, sampleSize)} #the counts for each question
+
+def update_state(state, header, rows):
+    """
+    Adds the new rows (the responses of each new respondent, from readRows()) to the counts and moves the watermark past them
+    The watermark stops at the last row with any response in it, so empty rows at the end of the sheet are read again by the next run (once the form has written to them)
+    """
+    state["header"] = tuple(header)
+    state["watermark"] += accumulators.accumulate(state["counts"], state["questions"], rows)
+    return state
+
+def make_tasks(state, leaveOut, summLen):
+    """
+    Returns the tasks for analysis_pipeline.analyse_tasks(), with the counts in place of the lists of responses
+    """
+    return accumulators.make_tasks(state["questions"], state["header"], state["counts"], leaveOut, summLen)
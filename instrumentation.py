@@ -0,0 +1,150 @@
+#Importing other python libraries
+import contextlib #for contextlib.contextmanager
+import cProfile #for profiling the functions called in each stage
+import io #for io.StringIO()
+import json #for writing the report
+import os #for os.path.splitext()
+import pstats #for sorting the profile
+import threading #for the lock shared by the measurements of every thread
+import time #for the wall time and CPU time
+import tracemalloc #for the peak memory of each stage and question
+try:
+    import resource #for the peak memory of the whole process (only available on Unix)
+except ImportError:
+    resource = None
+
+_active = [ ] #the measurements currently running in every thread, since the peak memory traced by tracemalloc is shared by the whole process
+_activeLock = threading.Lock() #stops two threads from resetting the peak memory at the same time
+
+@contextlib.contextmanager
+def measure(results, perThread=False):
+    """
+    Measures the wall time, CPU time and peak memory (in MB, of the Python objects created) of the code in the with block, and saves them in the results dictionary
+    Measurements can be nested: the peak memory of the outer measurement still includes the peak memory of the inner ones
+    If perThread is True, the CPU time is only that of the current thread (e.g. for a question written in the writer thread while the main thread carries on), rather than that of the whole process
+    The peak memory can only be traced for the whole process, so it also includes anything created by other threads at the same time
+
+    >>> results = { }
+    >>> with measure(results):
+    ...     numbers = list(range(100000))
+    >>> sorted(results)
+    ['cpu_s', 'peak_mb', 'wall_s']
+    >>> results["peak_mb"] > 1
+    True
+    """
+    cpuTime = time.thread_time if perThread else time.process_time
+    with _activeLock:
+        if not tracemalloc.is_tracing(): #tracemalloc is only started once something is measured, so it costs nothing otherwise
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        for other in _active: #the peak so far is saved for the other measurements (in this thread or another one), as it is about to be reset
+            other[1] = max(other[1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current] #the memory at the start, and the highest peak seen so far
+        _active.append(frame)
+    wallStart, cpuStart = time.perf_counter(), cpuTime()
+    try:
+        yield results
+    finally:
+        results["wall_s"] = time.perf_counter() - wallStart
+        results["cpu_s"] = cpuTime() - cpuStart
+        with _activeLock:
+            _active.remove(frame) #not always the last one, since measurements in different threads can overlap
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            for other in _active:
+                other[1] = max(other[1], peak)
+        results["peak_mb"] = (peak - frame[0])/1024.0/1024.0
+
+def report_name(docName, suffix="_report.json"):
+    """
+    Returns the name of the file the report is saved to, based on the name of the Word document
+
+    >>> report_name("response_analysis.docx")
+    'response_analysis_report.json'
+    >>> report_name("response_analysis.docx", "_profile.prof")
+    'response_analysis_profile.prof'
+    """
+    return os.path.splitext(docName)[0] + suffix
+
+class RunReport:
+    """
+    Keeps the wall time, CPU time and peak memory of each stage of a run and of each question, so that they can be saved as a JSON report
+    If profile is True, the functions called in each stage are also profiled with cProfile
+    """
+    def __init__(self, profile=False):
+        """
+        Initialises an empty report
+
+        >>> report = RunReport()
+        >>> with report.stage("readConfig"):
+        ...     pass
+        >>> list(report.stages)
+        ['readConfig']
+        """
+        self.stages = { } #the measurements of each stage, in the order they ran
+        self.questions = [ ] #the measurements of each question, in the order they were output
+        self.profiler = cProfile.Profile() if profile else None
+        self.threadProfilers = [ ] #the profiles of the code run in other threads (cProfile only profiles the thread it is enabled in)
+        self.started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Measures the stage of the run in the with block (and profiles it, if required)
+        """
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            with measure(self.stages.setdefault(name, { })):
+                yield
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+
+    @contextlib.contextmanager
+    def thread(self):
+        """
+        Profiles the code in the with block (if required) when it runs in a thread of its own, e.g. the writer thread, so that it is included in the profile of the run
+        """
+        if self.profiler is None:
+            yield
+            return
+        profiler = cProfile.Profile()
+        self.threadProfilers.append(profiler)
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+    def question(self, question, analysed):
+        """
+        Saves the measurements taken while analysing the question (from analysis_pipeline.analyse_question()), and returns a context manager that measures its output
+        The CPU time of the output is only that of the thread it is written in, since the next questions may be analysed at the same time
+        """
+        output = { }
+        self.questions.append({"qnNo": question.qNumber, "type": question.__class__.__name__, "analyse": analysed, "output": output})
+        return measure(output, perThread=True)
+
+    def save(self, docName, **details):
+        """
+        Saves the report (along with any other details about the run) next to the Word document, and the profile as well if there is one
+        Returns the name of the report
+        """
+        report = dict(details)
+        report["total_s"] = time.perf_counter() - self.started
+        if resource is not None:
+            report["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0 #ru_maxrss is in kilobytes on Linux
+        report["stages"] = self.stages
+        report["questions"] = self.questions
+        if self.profiler is not None:
+            profileName = report_name(docName, "_profile.prof")
+            summary = io.StringIO()
+            stats = pstats.Stats(self.profiler, *self.threadProfilers, stream=summary) #the profiles of every thread are combined
+            stats.dump_stats(profileName) #the full profile can be opened with pstats or snakeviz
+            stats.sort_stats("cumulative").print_stats(20)
+            report["profile"] = {"file": profileName, "top_cumulative": summary.getvalue().splitlines()}
+        reportName = report_name(docName)
+        with open(reportName, "w", encoding="utf-8") as reportFile:
+            json.dump(report, reportFile, indent=2)
+        return reportName
@@ -1,12 +1,13 @@
 #Importing my other python files
 from question_classes import NumericQn, CategoricalQn, FreeResponseQn, DemographicQn #python file containing classes for each question type, with functions to evaluate them
 
-#Importing other libraries
-import docx #allows me to write to a Microsoft Word Document
+#Importing other python libraries
+import io #for io.BytesIO()
 
-def console_output(question, exclude=[ ], summLen=5):
+def console_output(question, exclude=[ ], summLen=5, savePie=True):
     """
     Prints the evaluation of the data to the console
+    If savePie is True, the pie chart is also saved to a PNG file, and the name of the file is printed
 
     >>> console_output(DemographicQn(1, "Your Name"))
     
@@ -48,9 +49,9 @@ def console_output(question, exclude=[ ], summLen=5):
     Q4: What is your favourite part of the course? – FreeResponseQn
     Summary of responses:
     - Everything.
-    - Everything.
     - Learning about the shooting game.
     - Learning how to use the game block.
+    - Programming.
     - shooting game.
     """
     qType = question.__class__.__name__ #obtains the question type of the current question
@@ -62,15 +63,24 @@ def console_output(question, exclude=[ ], summLen=5):
             for sentence in question.summarize(sentenceNo=summLen, leaveOut=exclude): #iterates through each sentence in the summary, printing them out in point form
                 print("- {}".format(sentence))
         else: #if the question is a numerical or categorical question, print the mode, list out the choices and create the pie chart
-            print("Most popular choice: {}".format(question.mode())) #print the mode
-            print("\nChoices: ")
-            for choice, number in question.frequency().items(): #iterate through the choices and print out the number of responses per choice, as well as the percentage of responses per choice, in point form
-                percent = question.freqPercent()[choice]
-                print("- {} – {} ({:.1f}%)".format(choice, number, percent))
-            print("File name of pie chart: {}".format(question.plot_pie())) #creates a pie chart and prints out the name of the file
+            stats = question.stats() #obtains the statistics of the question, which are calculated only once and shared with docx_output()
+            if stats.bins is not None: #if there are too many different responses to list, print a table of the number of responses in each range instead
+                print("Most popular range: {}".format(stats.bins.mode))
+                print("\nResponses grouped into {} ranges:".format(len(stats.bins.frequency)))
+                printTable(binRows(stats.bins))
+            else:
+                print("Most popular choice: {}".format(stats.mode)) #print the mode
+                print("\nChoices: ")
+                for choice, number in stats.frequency.items(): #iterate through the choices and print out the number of responses per choice, as well as the percentage of responses per choice, in point form
+                    print("- {} – {} ({:.1f}%)".format(choice, number, stats.percent[choice]))
+            if stats.count > 0 and savePie: #a pie chart cannot be drawn if none of the responses are valid
+                print("File name of {}: {}".format("pie chart" if stats.bins is None else "histogram", question.plot_pie())) #saves the pie chart and prints out the name of the file
             if qType == "NumericQn": #if the question is a numeric question, print the mean and the median
-                print("\nAverage: {}".format(question.mean())) #print the mean
-                print("Median: {}".format(question.median())) #print the median
+                print("\nAverage: {}".format(stats.mean)) #print the mean
+                print("Median: {}".format(stats.median)) #print the median
+            if question.crossTab is not None: #if the survey is broken down by demographic questions, print a table with a row for each group
+                print("\nBroken down by {}:".format(question.crossTab.name))
+                printTable(crossTabRows(question.crossTab))
 
 def docx_output(question, doc, exclude=[ ], summLen=5):
     """
@@ -85,21 +95,127 @@ def docx_output(question, doc, exclude=[ ], summLen=5):
             for sentence in question.summarize(sentenceNo=summLen, leaveOut=exclude): #iterates throgh each sentence in the summary, writing them out in point form
                 doc.add_paragraph(sentence, style="List Bullet")
         else: #if the question is a numerical or categorical question, output the mode, list out the choices and display the pie chart
-            modePara = doc.add_paragraph("\nMost popular choice: ")
-            modePara.add_run(str(question.mode())) #write the mode to the Word document
-            modePara.runs[0].bold = True #bold "Most popular choice: "
-            choicesPara = doc.add_paragraph("Choices: ")
-            choicesPara.runs[0].bold = True #bold "Choices: "
-            for choice, number in question.frequency().items(): #iterate through the choices and list out the number of responses per choice, as well as the percentage of responses per choice, in point form
-                percent = question.freqPercent()[choice]
-                doc.add_paragraph("{} – {} ({:.1f}%)".format(choice, number, percent), style="List Bullet")
-            doc.add_picture(question.plot_pie(), height=docx.shared.Cm(8)) #add the pie chart to the Word document
+            stats = question.stats() #obtains the statistics of the question, which are shared with console_output()
+            if stats.bins is not None: #if there are too many different responses to list, add a table of the number of responses in each range instead
+                modePara = doc.add_paragraph("\nMost popular range: ")
+                modePara.add_run(str(stats.bins.mode)) #write the most popular range(s) to the Word document
+                modePara.runs[0].bold = True #bold "Most popular range: "
+                binsPara = doc.add_paragraph("Responses grouped into {} ranges: ".format(len(stats.bins.frequency)))
+                binsPara.runs[0].bold = True #bold "Responses grouped into ... ranges: "
+                addTable(doc, binRows(stats.bins))
+            else:
+                modePara = doc.add_paragraph("\nMost popular choice: ")
+                modePara.add_run(str(stats.mode)) #write the mode to the Word document
+                modePara.runs[0].bold = True #bold "Most popular choice: "
+                choicesPara = doc.add_paragraph("Choices: ")
+                choicesPara.runs[0].bold = True #bold "Choices: "
+                for choice, number in stats.frequency.items(): #iterate through the choices and list out the number of responses per choice, as well as the percentage of responses per choice, in point form
+                    doc.add_paragraph("{} – {} ({:.1f}%)".format(choice, number, stats.percent[choice]), style="List Bullet")
+            if stats.count > 0: #a pie chart cannot be drawn if none of the responses are valid
+                from docx.shared import Cm #python-docx is only imported when a Word document is written
+                doc.add_picture(io.BytesIO(question.chart()), height=Cm(8)) #add the pie chart to the Word document straight from memory
             if qType == "NumericQn": #if the question is a numeric question. output the mean and median
                 meanPara = doc.add_paragraph("Mean: ")
-                meanPara.add_run(str(question.mean())) #write out the mean to the Word document
+                meanPara.add_run(str(stats.mean)) #write out the mean to the Word document
                 meanPara.runs[0].bold = True #bold "Mean: "
                 medianPara = doc.add_paragraph("Median: ")
-                medianPara.add_run(str(question.median())) #write out the median to the Word document
+                medianPara.add_run(str(stats.median)) #write out the median to the Word document
                 medianPara.runs[0].bold = True #bold "Median"
+            if question.crossTab is not None: #if the survey is broken down by demographic questions, add a table with a row for each group
+                groupPara = doc.add_paragraph("Broken down by {}: ".format(question.crossTab.name))
+                groupPara.runs[0].bold = True #bold "Broken down by ...: "
+                addTable(doc, crossTabRows(question.crossTab))
         doc.add_page_break() #for numerical, categorical and free response questions, add a page break as the analysis for them is too long to fit another question in the same page
             
+
+def printTable(rows):
+    """
+    Prints the rows of text as a table, with the columns lined up
+
+    >>> printTable([["Range", "Responses"], ["0–9", "12"]])
+    Range  Responses
+    0–9    12
+    """
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))] #the width of each column of the table
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+def addTable(doc, rows):
+    """
+    Adds the rows of text to the Word document as a table, with the first row (the headings) in bold
+    """
+    table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+    table.style = "Table Grid"
+    for tableRow, row in zip(table.rows, rows):
+        for cell, text in zip(tableRow.cells, row):
+            cell.text = text
+    for cell in table.rows[0].cells: #bold the headings
+        for run in cell.paragraphs[0].runs:
+            run.bold = True
+
+def binRows(bins):
+    """
+    Returns the rows of text in the table of the number and percentage of responses in each range (the bins of a numeric question), starting with the headings
+
+    >>> binRows(NumericQn(2, "Score", list(range(30))).stats().bins)
+    [['Range', 'Responses', 'Percent'], ['0–2', '3', '10.0%'], ['3–5', '3', '10.0%'], ['6–8', '3', '10.0%'], ['9–11', '3', '10.0%'], ['12–14', '3', '10.0%'], ['15–17', '3', '10.0%'], ['18–20', '3', '10.0%'], ['21–23', '3', '10.0%'], ['24–26', '3', '10.0%'], ['27–29', '3', '10.0%']]
+    """
+    return [["Range", "Responses", "Percent"]] + [[label, str(number), "{:.1f}%".format(bins.percent[label])] for label, number in bins.frequency.items()]
+
+def crossTabRows(table):
+    """
+    Returns the rows of text in the table of a breakdown by group (a crosstab.CrossTab), starting with the headings
+    Each group has a row with its number of responses, the number and percentage of its responses per choice, and its mean and median for numeric questions
+
+    >>> import crosstab
+    >>> groups = crosstab.GroupIndex([["3A", "3B", "3A"]], ["Class"])
+    >>> crossTabRows(crosstab.cross_tab(groups, "numeric", [4, 2, 5]))
+    [['Class', 'Responses', '2', '4', '5', 'Mean', 'Median'], ['3A', '2', '0 (0.0%)', '1 (50.0%)', '1 (50.0%)', '4.5', '4.5'], ['3B', '1', '1 (100.0%)', '0 (0.0%)', '0 (0.0%)', '2.0', '2']]
+    """
+    numeric = table.means is not None #whether the mean and median are included
+    rows = [[table.name, "Responses"] + [str(choice) for choice in table.choices] + (["Mean", "Median"] if numeric else [ ])]
+    for i, group in enumerate(table.groups):
+        row = [group, str(table.totals[i])] + ["{} ({:.1f}%)".format(number, percent) for number, percent in zip(table.counts[i], table.percent[i])]
+        if numeric:
+            row += ["-" if table.means[i] is None else str(table.means[i]), "-" if table.medians[i] is None else str(table.medians[i])]
+        rows.append(row)
+    return rows
+
+def json_output(question, exclude=[ ], summLen=5):
+    """
+    Returns the evaluation of the data as a dictionary, which can be saved as JSON for other programs to read
+
+    >>> json_output(CategoricalQn(3, "Would you use Microbit again?", ["Yes", "No", "Yes", "Yes"]))
+    {'number': 3, 'statement': 'Would you use Microbit again?', 'type': 'CategoricalQn', 'mode': ['Yes'], 'choices': [{'choice': 'No', 'count': 1, 'percent': 25.0}, {'choice': 'Yes', 'count': 3, 'percent': 75.0}]}
+    >>> json_output(NumericQn(2, "Rate the course", [4, 5, 4]))["median"]
+    4
+    """
+    qType = question.__class__.__name__ #obtains the question type of the current question
+    result = {"number": question.qNumber, "statement": question.qStatement, "type": qType}
+    if qType == "FreeResponseQn":
+        result["summary"] = question.summarize(sentenceNo=summLen, leaveOut=exclude)
+    elif qType != "DemographicQn":
+        stats = question.stats() #obtains the statistics of the question
+        result["mode"] = [_plain(choice) for choice in stats.mode]
+        result["choices"] = [{"choice": _plain(choice), "count": number, "percent": stats.percent[choice]} for choice, number in stats.frequency.items()] #a list is used instead of a dictionary, since JSON keys can only be strings
+        if qType == "NumericQn":
+            result["mean"] = _plain(stats.mean)
+            result["median"] = _plain(stats.median)
+            if stats.bins is not None: #the number of responses in each range, if there are too many different responses to list
+                result["bins"] = [{"range": label, "count": number, "percent": stats.bins.percent[label]} for label, number in stats.bins.frequency.items()]
+        if question.crossTab is not None: #the breakdown by group, if the survey is broken down by demographic questions
+            table = question.crossTab
+            result["breakdown"] = {"by": table.name, "groups": [ ]}
+            for i, group in enumerate(table.groups):
+                groupResult = {"group": group, "count": table.totals[i], "choices": [{"choice": _plain(choice), "count": number, "percent": percent} for choice, number, percent in zip(table.choices, table.counts[i], table.percent[i])]}
+                if table.means is not None:
+                    groupResult["mean"] = table.means[i]
+                    groupResult["median"] = table.medians[i]
+                result["breakdown"]["groups"].append(groupResult)
+    return result
+
+def _plain(value):
+    """
+    Converts NumPy numbers to plain Python numbers, so that they can be saved as JSON
+    """
+    return value.item() if hasattr(value, "item") else value
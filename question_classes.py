@@ -1,15 +1,60 @@
 #Import other python libraries
+import io #for io.BytesIO()
 import math #for math.ceil()
-import string #for string.punctuation
 
 #Import other libraries from external sources
-from matplotlib import pyplot as plt #allows me to create pie charts 
-from sumy.summarizers.luhn import LuhnSummarizer #allows me to summarise free response data
-                                                 #the rest of the items imported are also for the summarizer
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.stemmers import Stemmer
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.utils import get_stop_words
+import numpy as np #allows me to store numeric responses in compact arrays
+#matplotlib (for the pie charts) and the summariser (which loads sumy and NLTK) take a while to import, so they are only imported the first time they are needed
+
+_plt = None #matplotlib's pyplot, once it has been imported by _pyplot()
+
+def _pyplot():
+    """
+    Returns matplotlib's pyplot, importing it the first time a pie chart is drawn
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use("Agg") #the charts are only saved and never shown, so a non-interactive backend is used
+        from matplotlib import pyplot #allows me to create pie charts
+        _plt = pyplot
+    return _plt
+
+class QnStats:
+    """
+    The statistics of a question, calculated in a single pass through its responses
+    Both output methods read from the same object, so nothing is recalculated for the second output
+    """
+    def __init__(self, frequency):
+        """
+        Calculates the statistics from a dictionary containing the number of responses per choice
+
+        >>> stats = QnStats({1: 2, 2: 4, 3: 1, 4: 1})
+        >>> stats.count
+        8
+        >>> stats.percent
+        {1: 25.0, 2: 50.0, 3: 12.5, 4: 12.5}
+        >>> stats.mode
+        [2]
+        """
+        self.frequency = frequency #the number of responses per choice
+        self.count = sum(frequency.values()) #the total number of responses
+        lstLen = float(self.count) #saved as a float such that the percentage would not be unnecessarily rounded to the nearest integer
+        self.percent = {choice: (freq/lstLen)*100 for choice, freq in frequency.items()} #the percentage of responses per choice
+        highestFreq = max(frequency.values(), default=0) #the number of people who chose the most popular choice
+        self.mode = [choice for choice, freq in frequency.items() if freq == highestFreq] #all the choices that are as popular as the most popular choice
+        self.mean = None #the mean and median are only calculated for numeric questions
+        self.median = None
+        self.bins = None #the statistics of the responses grouped into ranges (a QnStats object), only for numeric questions with too many different responses to show one at a time
+
+def _toPNG(figure):
+    """
+    Saves the figure as PNG data in memory instead of in a file, then closes it, since it is no longer needed
+    """
+    pngData = io.BytesIO()
+    figure.savefig(pngData, format="png", bbox_inches='tight', pad_inches=0.5)
+    _pyplot().close(figure)
+    return pngData.getvalue()
 
 class Qn:
     """
@@ -29,6 +74,70 @@ class Qn:
         self.qNumber = questionNo #sets the question number
         self.qStatement = questionSt #sets the question statement
         self.responses = sorted(list(questionResp)) #sets the responses, sorted (to make numerical responses more presentable)
+    @classmethod
+    def fromCounts(cls, questionNo, questionSt, frequency):
+        """
+        Creates the question from a dictionary containing the number of responses per choice, instead of a list of responses
+        The question is the same as one created from the same responses in any order, but only the counts are kept in memory (the list of responses is only rebuilt if it is asked for)
+
+        >>> Qn.fromCounts(1, "Random question", {"Hi": 1, "Hello": 2}).responses
+        ['Hello', 'Hello', 'Hi']
+        """
+        question = cls.__new__(cls)
+        question.qNumber = questionNo #sets the question number
+        question.qStatement = questionSt #sets the question statement
+        question._responses = None #the responses are not kept
+        question._counts = {choice: frequency[choice] for choice in sorted(frequency)} #the number of responses per choice, arranged in order
+        question._resetCache()
+        return question
+    @property
+    def responses(self):
+        """
+        The responses to the question
+        Setting new responses throws away the cached statistics, so they will be recalculated the next time they are needed
+        """
+        if self._responses is None: #the question was created from counts, so the responses are rebuilt from them
+            return [choice for choice, freq in self._counts.items() for i in range(freq)]
+        return self._responses
+    @responses.setter
+    def responses(self, questionResp):
+        self._responses = questionResp
+        self._counts = None
+        self._resetCache() #the results calculated from the old responses are no longer valid
+    def _resetCache(self):
+        """
+        Throws away the statistics, pie chart and summaries calculated from the previous responses
+        """
+        self._stats = None
+        self._chart = None
+        self._pieName = None
+        self._summaries = { }
+        self.crossTab = None #the breakdown of the responses by group (a crosstab.CrossTab), only worked out if the survey is broken down by demographic questions
+    def stats(self):
+        """
+        Returns the statistics of the question (a QnStats object), calculating them in one pass the first time they are needed
+        The same object is returned until the responses change
+
+        >>> q = Qn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"])
+        >>> q.stats() is q.stats()
+        True
+        >>> q.responses = ["Hi", "Hi"]
+        >>> q.stats().frequency
+        {'Hi': 2}
+        """
+        if self._stats is None:
+            self._stats = self._calcStats()
+        return self._stats
+    def _calcStats(self):
+        """
+        Counts the number of responses per choice in a single pass and calculates the statistics from the counts
+        """
+        if self._responses is None: #the question was created from counts, so there is nothing to count
+            return QnStats(dict(self._counts))
+        frequency = { } #initialises the dictionary
+        for choice in self.responses: #iterates through the responses once, adding 1 to the response count for each choice
+            frequency[choice] = frequency.get(choice, 0) + 1
+        return QnStats(frequency)
     def frequency(self):
         """
         Returns a dictionary containing the number of responses per choice (mostly for numerical and categorical data)
@@ -38,12 +147,7 @@ class Qn:
         >>> Qn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).frequency()
         {1: 2, 2: 4, 3: 1, 4: 1}
         """
-        frequency = { } #initialises the output dictionary
-        for choice in self.responses: #iterates through the responses
-            if choice not in frequency.keys(): #if the current choice is not previously recorded in the dictionary, create a new entry and set it to 0
-                frequency[choice] = 0
-            frequency[choice] += 1 #for all cases, add 1 to the total response count for the choice
-        return frequency #return the dictionary
+        return dict(self.stats().frequency) #returns a copy, so that changing it does not change the cached statistics
     def freqPercent(self):
         """
         Returns a dictionary containing the percentage of responses per choice (as compared to the total number of responses) (mostly for numerical and categorical data)
@@ -53,13 +157,7 @@ class Qn:
         >>> Qn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).freqPercent()
         {1: 25.0, 2: 50.0, 3: 12.5, 4: 12.5}
         """
-        frequency = self.frequency() #obtains the dictionary with the number of responses per choice
-        lstLen = float(len(self.responses)) #find out the total number of reponses
-                                            #it is saved as a float such that the percentage would not be unnecessarily rounded to the nearest integer (making the results inaccurate)
-        freqPercent = { } #initialises the output dictionary
-        for choice, freq in frequency.items(): #iterates through each choice
-            freqPercent[choice] = (freq/lstLen)*100 #converts the absolute number of reponses per choice to a percentage and saves it into the new dictionary
-        return freqPercent #returns the dictionary
+        return dict(self.stats().percent) #returns a copy of the cached percentages
     def mode(self):
         """
         Returns the most frequent choice (mostly for numerical and categorical data)
@@ -71,29 +169,25 @@ class Qn:
         >>> Qn(3, "Yet another random question", [1, 2, 1, 1, 2, 4, 2, 3]).mode()
         [1, 2]
         """
-        frequency = self.frequency() #obtains the dictionary with the number of responses
-        mode = [ ] #in case that there is more than 1 mode, all modes are saved into this list
-        highestFreq = max(frequency.values()) #searches for the number of people who chose the most popular choice
-        for choice, freq in frequency.items(): #searches through the frequency dictionary to save all the choices that have the same number of respondents as the most popular choice (basically, search for the most popular choice(s))
-                                               #and save it to the list of modes
-            if freq == highestFreq:
-                mode.append(choice)
-        return mode #return the mode(s)
-    def plot_pie(self):
+        return list(self.stats().mode) #returns a copy of the cached mode(s)
+    def chart(self):
         """
-        Creates a pie chart that reflects the distribution of responses per choice and saves it according to the question number
-        Returns the name of the file containing the pie chart
+        Draws a pie chart that reflects the distribution of responses per choice
+        Returns the chart as PNG data, which can be added straight to the Word document without saving it to a file
+        The chart is only drawn once, and the figure is closed afterwards so that it does not take up memory
 
-        >>> Qn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"]).plot_pie()
-        'Q1_pie.png'
-        Qn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).plot_pie()
-        'Q2_pie.png'
+        >>> Qn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"]).chart()[:8]
+        b'\\x89PNG\\r\\n\\x1a\\n'
         """
-        pieChart = plt.subplots()[1] #initialise the subplot
+        if self._chart is not None: #the pie chart has already been drawn (e.g. by a worker process or by the other output method)
+            return self._chart
+        plt = _pyplot()
+        figure, pieChart = plt.subplots() #initialise the subplot
         pieChart.set_title("Q{}: {}".format(self.qNumber, self.qStatement)) #set the title of the pie chart (<question number>: <question statement>)
-        choices = self.frequency().keys() #obtains the list of choices
-        exact = self.frequency().values() #obtains the list of responses per choice
-        percent = self.freqPercent().values() #obtains the list of percentage of responses per choice
+        stats = self.stats() #obtains the statistics of the question
+        choices = stats.frequency.keys() #obtains the list of choices
+        exact = stats.frequency.values() #obtains the list of responses per choice
+        percent = stats.percent.values() #obtains the list of percentage of responses per choice
         def label(pct, exact):
             """
             Arranges the percentage of responses and number of responses for the relevant choice in a way that is suitable for displaying on the pie chart
@@ -103,8 +197,25 @@ class Qn:
         pieChart.pie(percent, autopct=lambda pct: label(pct, exact), startangle=90) #create the pie chart, along with the labels
         pieChart.legend(choices, title="Choices", loc="center left", bbox_to_anchor=(0.85, 0, 0.5, 1)) #creates a legend to the right of the pie chart
         pieChart.axis('equal') #ensure that the pie chart is in a circle
-        pieName = "Q{}_pie.png".format(self.qNumber) #names the pie chart according to the question number
-        plt.savefig(pieName, bbox_inches='tight', pad_inches=0.5) #saves the pie chart to a PNG file
+        self._chart = _toPNG(figure) #remembers the pie chart, so that it is never drawn again
+        return self._chart
+    def plot_pie(self):
+        """
+        Creates a pie chart that reflects the distribution of responses per choice and saves it according to the question number
+        Returns the name of the file containing the pie chart (or the histogram, for numeric questions with responses grouped into ranges)
+        The chart is drawn by chart(), so saving it to a file does not draw it again
+
+        >>> Qn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"]).plot_pie()
+        'Q1_pie.png'
+        Qn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).plot_pie()
+        'Q2_pie.png'
+        """
+        if self._pieName is not None: #the pie chart has already been saved
+            return self._pieName
+        pieName = "Q{}_{}.png".format(self.qNumber, "pie" if self.stats().bins is None else "histogram") #names the pie chart according to the question number
+        with open(pieName, "wb") as pieFile: #saves the pie chart to a PNG file
+            pieFile.write(self.chart())
+        self._pieName = pieName #remembers that the pie chart has been saved
         return pieName #returns the name of the PNG file where the pie chart is saved in
 
 
@@ -115,12 +226,15 @@ class NumericQn(Qn):
     def __init__(self, questionNo, questionSt, questionResp):
         """
         Largely the same as the __init__() function in the Qn() class, but ensures that the responses are intergers.
-        
-        >>> NumericQn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"])
-        Error: Numeric questions should have integer responses
-        Traceback (most recent call last):
-          ...
-        TypeError: __init__() should return None, not 'str'
+        The responses are kept in a compact NumPy array instead of a sorted list
+        Responses that are not numbers are left out, and their positions are reported and saved in invalidRows
+
+        >>> NumericQn(1, "Random question", ["Hello", "Hi", "Random", "Incorrect", "Hello"]).invalidRows
+        Error: Numeric questions should have integer responses (Q1: responses 1, 2, 3, 4, 5 are left out)
+        [1, 2, 3, 4, 5]
+        >>> NumericQn(1, "Random question", [3, None, "4", 5]).responses
+        Error: Numeric questions should have integer responses (Q1: responses 2 are left out)
+        [3, 4, 5]
         >>> NumericQn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).qNumber
         2
         >>> NumericQn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).qStatement
@@ -128,16 +242,109 @@ class NumericQn(Qn):
         >>> NumericQn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).responses
         [1, 1, 2, 2, 2, 2, 3, 4]
         """
-        for r in questionResp:
-            try:
-                int(r)
-            except:
-                print("Error: Numeric questions should have integer responses")
-                return "ERROR" #communicates with the main program, informing it of an error
-                               #I initially wanted to check for the "ERROR" string, but I realised that this produced a TypeError since __init__() functions are not supposed to return anything other than None
-                               #hence in the main program, I will check for TypeErrors instead
-        Qn.__init__(self, questionNo, questionSt, questionResp)
+        self.qNumber = questionNo #sets the question number
+        self.qStatement = questionSt #sets the question statement
+        self.responses = questionResp #checks the responses and stores them in an array (see the setter below)
+    @property
+    def responses(self):
+        """
+        The responses to the question, arranged in order
+        They are rebuilt from the number of responses per choice, so the array never has to be sorted
+        """
+        stats = self.stats()
+        return np.repeat(list(stats.frequency.keys()), list(stats.frequency.values())).tolist()
+    @responses.setter
+    def responses(self, questionResp):
+        self._values, self.invalidRows = self._toArray(questionResp) #the valid responses (in their original order) and the positions of the invalid ones
+        self._counts = None
+        self._resetCache() #the results calculated from the old responses are no longer valid
+        self._reportInvalid()
+    maxChoices = 20 #questions with more different responses than this are shown as a histogram, with the responses grouped into ranges
+    bins = 10 #the number of ranges in the histogram (fewer if there are fewer whole numbers between the lowest and highest response)
+    def _reportInvalid(self):
+        """
+        Instead of stopping the whole program, the invalid responses are reported (and left out)
+        """
+        if self.invalidRows:
+            print("Error: Numeric questions should have integer responses (Q{}: responses {} are left out)".format(self.qNumber, ", ".join(str(row) for row in self.invalidRows)))
+    @classmethod
+    def fromCounts(cls, questionNo, questionSt, frequency, invalidRows=[ ]):
+        """
+        Creates the question from a dictionary containing the number of (valid) responses per choice, along with the positions of the invalid responses
 
+        >>> NumericQn.fromCounts(2, "Another random question", {2: 4, 1: 2, 3: 1, 4: 1}).median()
+        2.0
+        >>> NumericQn.fromCounts(2, "Another random question", {4: 1}, [2]).responses
+        Error: Numeric questions should have integer responses (Q2: responses 2 are left out)
+        [4]
+        """
+        question = cls.__new__(cls)
+        question.qNumber = questionNo #sets the question number
+        question.qStatement = questionSt #sets the question statement
+        choices = sorted(frequency)
+        question._values = None #the responses are not kept, only the number of responses per choice
+        question._counts = (np.array(choices), np.array([frequency[choice] for choice in choices], dtype=np.int64))
+        question.invalidRows = list(invalidRows)
+        question._resetCache()
+        question._reportInvalid()
+        return question
+    @property
+    def values(self):
+        """
+        The valid responses, as a NumPy array
+        If the question was created from counts, the array is rebuilt from them (in order)
+        """
+        if self._values is None:
+            return np.repeat(*self._counts)
+        return self._values
+    @staticmethod
+    def _toArray(questionResp):
+        """
+        Converts the responses to a NumPy array, checking all of them at once instead of one by one
+        Returns the array of valid responses, along with a list of the positions (counting from 1) of the responses that are not numbers
+
+        >>> NumericQn._toArray(["1", " 2", "-3", "x", "4.5"])
+        (array([ 1,  2, -3]), [4, 5])
+        >>> NumericQn._toArray([4, None, 5, None])
+        (array([4, 5]), [2, 4])
+        >>> NumericQn._toArray([4, 4.5, "N/A"])
+        (array([4. , 4.5]), [3])
+        >>> NumericQn._toArray(["99999999999999999999", "3"])
+        (array([1.e+20, 3.e+00]), [])
+        """
+        values = np.empty(len(questionResp), dtype=object) #an object array keeps each response as it is, instead of turning numbers into text when they are mixed with text
+        values[:] = list(questionResp)
+        types = set(map(type, values.tolist())) #the types of the responses
+        try:
+            if types <= {int, float, type(None)}: #numbers with empty cells (the usual column from an Excel sheet), which are checked all at once with the empty cells as NaN
+                floats = np.where(np.equal(values, None), np.nan, values).astype(np.float64)
+                valid = np.isfinite(floats)
+                return floats[valid] if float in types else values[valid].astype(np.int64), (np.flatnonzero(~valid)+1).tolist() #integer responses stay integers
+            if types == {str}: #text, which is only accepted if it is made up of digits (with an optional sign)
+                stripped = np.char.strip(values.astype(str))
+                unsigned = np.where(np.char.startswith(stripped, "-") | np.char.startswith(stripped, "+"), np.char.lstrip(stripped, "+-"), stripped)
+                valid = np.char.isdecimal(unsigned) & (np.char.str_len(stripped)-np.char.str_len(unsigned) <= 1)
+                return np.where(valid, stripped, "0").astype(np.int64)[valid], (np.flatnonzero(~valid)+1).tolist()
+        except OverflowError: #integers too large for NumPy are checked one by one below instead
+            pass
+        #a mix of numbers and text (or integers too large for NumPy), where each response has to be checked for its type
+        valid = np.frompyfunc(NumericQn._isNumber, 1, 1)(values).astype(bool) if len(values) else np.zeros(0, dtype=bool)
+        values = np.array([int(r) if isinstance(r, str) else r for r in values[valid]]) if valid.any() else np.zeros(0, dtype=np.int64)
+        if values.dtype == object: #integers too large for NumPy are kept as decimals, so that the statistics can still be worked out
+            values = values.astype(np.float64)
+        return values, (np.flatnonzero(~valid)+1).tolist()
+    @staticmethod
+    def _isNumber(response):
+        """
+        Checks if a single response can be used as a number
+        """
+        if isinstance(response, str):
+            return response.strip().lstrip("+-").isdecimal() and len(response.strip())-len(response.strip().lstrip("+-")) <= 1
+        try:
+            int(response)
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return not isinstance(response, bool)
     def mean(self):
         """
         Returns the average choice out of all the responses
@@ -145,10 +352,7 @@ class NumericQn(Qn):
         >>> NumericQn(2, "Another random question", [1, 2, 1, 2, 2, 4, 2, 3]).mean()
         2.125
         """
-        lstSum = sum(self.responses) #adds up all the responses
-        lstLen = len(self.responses) #calculates the number of responses
-        mean = lstSum/lstLen #calculates the average response
-        return mean #returns the average response
+        return self.stats().mean #returns the cached average response
     def median(self):
         """
         Returns the middle choice when all responses are arranges in order
@@ -159,54 +363,210 @@ class NumericQn(Qn):
         >>> NumericQn(3, "Yet another random question", [1, 2, 1, 1, 2, 4, 2]).median()
         2
         """
-        lstLen = len(self.responses) #calculates the number of respondents
-        if lstLen%2 == 0: #if there is an even number of responses, set the median to the average of the 2 middle responses and
-            mid1 = self.responses[lstLen//2]
-            mid2 = self.responses[(lstLen//2)-1]
-            median = (mid1+mid2)/2.0
-        else: #if there is an odd number of responses, set the median to the middle response
-            median = self.responses[lstLen//2]
-        return median #return the median
+        return self.stats().median #returns the cached median
+    def _calcStats(self):
+        """
+        Counts the responses with np.bincount() (or np.unique() if the range of responses is too wide), then calculates the mean and median from the counts
+        """
+        choices, counts = self._counts if self._values is None else self._count(self._values) #if the question was created from counts, there is nothing to count
+        stats = QnStats(dict(zip(choices.tolist(), counts.tolist()))) #the statistics shared with the other questions (the choices are converted back to normal python numbers)
+        lstLen = stats.count #the number of respondents
+        if lstLen > 0:
+            stats.mean = (choices*counts).sum().item()/lstLen #calculates the average response
+            stats.median = self._medianFromCounts(choices, counts, lstLen)
+        if len(choices) > self.maxChoices: #there are too many different responses to show one at a time, so they are grouped into ranges
+            stats.bins = QnStats(self._binCounts(choices, counts, self.bins))
+        return stats
+    @staticmethod
+    def _binEdges(choices, binCount):
+        """
+        Splits the span from the lowest to the highest choice (in order) into binCount ranges of (nearly) the same width
+        Returns the edges of the ranges and the label of each range: each range holds the choices from its edge up to (but not including) the next edge, and the last range holds the highest choice as well
+        Whole numbers are split into ranges of whole numbers (e.g. 0–19), so there are only fewer than binCount ranges if there are fewer than binCount whole numbers from the lowest to the highest choice
+
+        >>> NumericQn._binEdges(np.array([0, 37, 100]), 5)
+        (array([  0,  20,  40,  60,  80, 101]), ['0–19', '20–39', '40–59', '60–79', '80–100'])
+        >>> NumericQn._binEdges(np.array([0.0, 1.2, 2.0]), 4)
+        (array([0. , 0.5, 1. , 1.5, 2. ]), ['[0, 0.5)', '[0.5, 1)', '[1, 1.5)', '[1.5, 2]'])
+        """
+        lowest, highest = choices[0].item(), choices[-1].item()
+        if choices.dtype.kind in "iu":
+            span = highest-lowest+1 #the number of whole numbers from the lowest to the highest choice
+            binCount = min(binCount, span)
+            edges = lowest + (np.arange(binCount+1)*span)//binCount #the last edge is just past the highest choice
+            labels = [str(low) if high-low == 1 else "{}–{}".format(low, high-1) for low, high in zip(edges[:-1].tolist(), edges[1:].tolist())]
+        else:
+            edges = np.linspace(lowest, highest, binCount+1)
+            labels = ["[{:g}, {:g}{}".format(low, high, "]" if i == binCount-1 else ")") for i, (low, high) in enumerate(zip(edges[:-1].tolist(), edges[1:].tolist()))]
+        return edges, labels
+    @staticmethod
+    def _binCodes(edges, values):
+        """
+        Returns the range (from _binEdges()) of each value, working them all out at once
+
+        >>> NumericQn._binCodes(np.array([0, 20, 40, 60, 80, 101]), np.array([0, 19, 20, 100]))
+        array([0, 0, 1, 4])
+        """
+        return np.minimum(np.searchsorted(edges, values, side="right")-1, len(edges)-2) #the highest choice is put in the last range
+    @staticmethod
+    def _binCounts(choices, counts, binCount):
+        """
+        Groups the choices (in order) into binCount ranges (see _binEdges()), and returns the number of responses in each range
+        Each choice is put in its range in one pass through the counts per choice
+
+        >>> NumericQn._binCounts(np.array([3, 5, 12, 19, 40]), np.array([1, 1, 2, 1, 3]), 4)
+        {'3–11': 2, '12–21': 3, '22–30': 0, '31–40': 3}
+        >>> NumericQn._binCounts(np.array([0.5, 1.0, 2.5]), np.array([1, 2, 1]), 2)
+        {'[0.5, 1.5)': 3, '[1.5, 2.5]': 1}
+        """
+        edges, labels = NumericQn._binEdges(choices, binCount)
+        binned = np.bincount(NumericQn._binCodes(edges, choices), weights=counts, minlength=len(labels)).astype(np.int64)
+        return dict(zip(labels, binned.tolist()))
+    def chart(self):
+        """
+        Draws a bar chart of the number of responses in each range if the responses are grouped into ranges (see stats().bins), or a pie chart otherwise
+
+        >>> NumericQn(1, "Minutes spent on homework", list(range(100))).chart()[:8]
+        b'\\x89PNG\\r\\n\\x1a\\n'
+        """
+        bins = self.stats().bins
+        if self._chart is not None or bins is None:
+            return super().chart()
+        plt = _pyplot()
+        figure, barChart = plt.subplots() #initialise the subplot
+        barChart.set_title("Q{}: {}".format(self.qNumber, self.qStatement)) #set the title of the bar chart (<question number>: <question statement>)
+        bars = barChart.bar(list(bins.frequency.keys()), list(bins.frequency.values())) #one bar for each range
+        barChart.bar_label(bars, labels=["{}\n({:.1f}%)".format(freq, pct) for freq, pct in zip(bins.frequency.values(), bins.percent.values())], fontsize=8) #the number and percentage of responses above each bar
+        barChart.set_xlabel("Responses")
+        barChart.set_ylabel("Number of responses")
+        barChart.tick_params(axis="x", labelrotation=45)
+        self._chart = _toPNG(figure) #remembers the bar chart, so that it is never drawn again
+        return self._chart
+    @staticmethod
+    def _count(values):
+        """
+        Returns the choices (in order) and the number of responses for each choice
+
+        >>> NumericQn._count(np.array([3, 1, 3, 7]))
+        (array([1, 3, 7]), array([1, 2, 1]))
+        """
+        if values.dtype.kind in "iu" and len(values) > 0:
+            lowest = values.min()
+            spread = values.max().item()-lowest.item()
+            if spread <= 2*len(values)+1024: #counting into one bin per possible value is only worth it if the range of values is small
+                counts = np.bincount(values-lowest, minlength=spread+1)
+                choices = np.flatnonzero(counts)
+                return choices+lowest, counts[choices]
+        return np.unique(values, return_counts=True)
+    @staticmethod
+    def _medianFromCounts(choices, counts, lstLen):
+        """
+        Finds the median from the running total of the number of responses per choice, instead of sorting all the responses
+        If there is an even number of reponses, the average of the middle choices is returned
+        """
+        runningTotal = np.cumsum(counts)
+        def nthChoice(n):
+            """
+            Returns the choice of the nth response (counting from 0) when all responses are arranged in order
+            """
+            return choices[np.searchsorted(runningTotal, n, side="right")].item()
+        if lstLen%2 == 0: #if there is an even number of responses, set the median to the average of the 2 middle responses
+            return (nthChoice(lstLen//2)+nthChoice((lstLen//2)-1))/2.0
+        return nthChoice(lstLen//2) #if there is an odd number of responses, set the median to the middle response
 
 class CategoricalQn(Qn):
     """
     The class containing functions specific to categorical questions
-    As all the functions required for categorical questions are already defined in the Qn() class, this class is empty and inherits all of its methods from the Qn class
+    The responses are stored dictionary-encoded: each choice is only kept once (in order) in categories, and each response is kept as a small integer code, which is the position of its choice in categories
+    The rest of the functions are inherited from the Qn class
     """
-    pass
+    def __init__(self, questionNo, questionSt, questionResp):
+        """
+        Initialises the question number, question statement and the responses for that particular question
+
+        >>> q = CategoricalQn(3, "Would you use Microbit again?", ["Yes", "No", "Yes", "Maybe"])
+        >>> q.categories, q.codes
+        (['Maybe', 'No', 'Yes'], array([2, 1, 2, 0], dtype=uint8))
+        >>> q.responses
+        ['Maybe', 'No', 'Yes', 'Yes']
+        """
+        self.qNumber = questionNo #sets the question number
+        self.qStatement = questionSt #sets the question statement
+        self.responses = questionResp #encodes the responses
+    @classmethod
+    def fromCounts(cls, questionNo, questionSt, frequency):
+        """
+        Creates the question from a dictionary containing the number of responses per choice, instead of a list of responses
+        Only the choices and the number of responses per choice are kept (there are no codes)
+
+        >>> CategoricalQn.fromCounts(3, "Would you use Microbit again?", {"Yes": 2, "No": 1}).frequency()
+        {'No': 1, 'Yes': 2}
+        """
+        question = cls.__new__(cls)
+        question.qNumber = questionNo #sets the question number
+        question.qStatement = questionSt #sets the question statement
+        question.categories = sorted(frequency) #the choices, arranged in order
+        question.codes = None #the responses are not kept
+        question._counts = np.array([frequency[choice] for choice in question.categories], dtype=np.int64) #the number of responses per choice, in the same order as the choices
+        question._resetCache()
+        return question
+    @property
+    def responses(self):
+        """
+        The responses to the question, decoded and arranged in order
+        Setting new responses encodes them, and throws away the cached statistics
+        """
+        if self.codes is None: #the question was created from counts, so the responses are rebuilt from them
+            return [choice for choice, freq in zip(self.categories, self._counts.tolist()) for i in range(freq)]
+        return [self.categories[code] for code in np.sort(self.codes).tolist()] #sorting the codes sorts the responses, since the choices are in order
+    @responses.setter
+    def responses(self, questionResp):
+        self.categories, self.codes = self._encode(questionResp)
+        self._counts = None
+        self._resetCache() #the results calculated from the old responses are no longer valid
+    @staticmethod
+    def _encode(questionResp):
+        """
+        Returns the choices (in order) and the code of each response
+        Each response is looked up in a dictionary, so only the distinct choices are ever sorted, and the codes use the smallest integer type that fits
+
+        >>> CategoricalQn._encode(["b", "a", "b"])
+        (['a', 'b'], array([1, 0, 1], dtype=uint8))
+        """
+        firstSeen = { } #the code of each choice, in the order the choices are first seen
+        codes = np.fromiter((firstSeen.setdefault(response, len(firstSeen)) for response in questionResp), dtype=np.int64, count=len(questionResp))
+        categories = sorted(firstSeen) #the choices, arranged in order
+        newCodes = np.empty(len(categories), dtype=np.min_scalar_type(max(len(categories)-1, 0))) #converts the codes from the order the choices were first seen to the sorted order
+        newCodes[[firstSeen[choice] for choice in categories]] = np.arange(len(categories))
+        return categories, newCodes[codes]
+    def _calcStats(self):
+        """
+        Counts the number of responses per choice straight from the codes and calculates the statistics from the counts
+        """
+        counts = self._counts if self.codes is None else np.bincount(self.codes, minlength=len(self.categories))
+        return QnStats(dict(zip(self.categories, counts.tolist())))
 
 class FreeResponseQn(Qn):
     """
     The class containing functions specific to free response questions
     """
+    chunkSize = None #if set, the responses are summarised in chunks of this many responses (see Summariser.summarize())
+    summaryJobs = 1 #the number of worker processes that summarise the chunks
+
     def summarize(self, sentenceNo=5, leaveOut=[ ]):
         """
         Returns a summary of all the responses, excuding irrelevant responses stated in the leaveOut parameter
+        Each summary is only worked out once for the same sentenceNo and leaveOut (until the responses change)
+        If chunkSize is set, the summary is picked from the summaries of chunks of the responses, so large questions take less time and memory
 
         >>> FreeResponseQn(4, "Randome response question", ["I like apples", "I like pears", "Everything", "I love microbit", "Nil", "None", "Python rocks!", "Nil", "Nothing", "I like oranges too", "Python is the best", "-", "Microbit is the best", "I love python", "Javascript is better", "Nil", "Maybe we should use C++", "Nothing", "Apple is the best", "Apples", "Everything", "Python", "Apples are better than pears", "Nothing", "-", "Mircrobit and Python", "Apples and oranges"]).summarize(sentenceNo=3, leaveOut=["everything", "nil", "none", "nothing", "-"])
         ['Apples and oranges.', 'I love microbit.', 'I love python.']
         """
-        def stripPunct(response):
-            """
-            Removes all punctuation from the responses. This allows for easier manipulation of the responses later
-            """
-            for ch in string.punctuation: #iterates through each punctuation 
-                response = response.replace(ch, "") #removes all instances of the current punctuation in the given string
-            return response#returns the string, with all the puctuations removed
-        
-        resp = "" #initialises the string to store all the (relevant) responses
-        for r in self.responses: #iterates through the responses
-            r = stripPunct(r) #removes all punctuation from the current response
-            if r.strip().lower() not in leaveOut: #if the current response is relevant, add a full stop behind and include it in the string of relevant responses
-                resp += r + ". "
-        parseResp = PlaintextParser.from_string(resp, Tokenizer("english")) #parses the string such that it can be used in the summariser
-        s = LuhnSummarizer(Stemmer("english")) #initialises the summariser
-        s.stop_words = get_stop_words("english") #updates the stop words used for the summariser
-        summarized = s(parseResp.document, sentenceNo) #summarises the text
-        summaryLst = [ ] #initialises a list to store each sentence in the summary (for easy output)
-        for sentence in summarized: #iterates through each sentence in the summary, converting them to strings before adding them in the new summary list
-            summaryLst.append(str(sentence))
-        return summaryLst #returns the summary list
+        summaryKey = (sentenceNo, tuple(leaveOut), self.chunkSize) #the summaries already worked out are saved according to the settings used
+        if summaryKey not in self._summaries:
+            from summariser import get_summariser #python file containing the summariser shared by all free response questions (only imported once a summary is needed)
+            self._summaries[summaryKey] = get_summariser().summarize(self.responses, sentenceNo, leaveOut, self.chunkSize, self.summaryJobs) #the summariser is shared by every question, so its resources are only loaded once
+        return list(self._summaries[summaryKey]) #returns a copy of the summary list
 
 class DemographicQn:
     """
@@ -2,7 +2,7 @@ def readConfig(configName="config.txt"):
     """
     Reads the information from configuration file (config.txt)
     Returns the following information in a list:
-    1) The name of the Excel file containing the designated Excel sheet
+    1) The name of the Excel file containing the designated Excel sheet (or of a CSV file)
     2) The name of the Excel sheet to read the data from
     3) The name of the Word document to save the analysis to
     4) A dictionary with the details of each question
@@ -15,7 +15,7 @@ def readConfig(configName="config.txt"):
     'ERROR'
     
     >>> readConfig("./config_testing/config-wrong(1).txt")
-    Error on line 1: Incorrect file type. Your filename should end in '.xlsx'
+    Error on line 1: Incorrect file type. Your filename should end in '.xlsx' or '.csv'
     'ERROR'
     >>> readConfig("./config_testing/config-wrong(5).txt")
     Error on line 5: Please enter the number of lines you want in your summary
@@ -41,11 +41,11 @@ def readConfig(configName="config.txt"):
         print("Error on line 1: Please enter the name of a file")
         return "ERROR" 
     else:
-        if ".xlsx" not in filename:
-            print("Error on line 1: Incorrect file type. Your filename should end in '.xlsx'")
+        if ".xlsx" not in filename and ".csv" not in filename:
+            print("Error on line 1: Incorrect file type. Your filename should end in '.xlsx' or '.csv'")
             return "ERROR" 
     try:
-        sheetname = str(config.readline().replace("\n", "").split(": ")[1])#obtains the name of the Excel sheet
+        sheetname = str(config.readline().replace("\n", "").split(": ")[1])#obtains the name of the Excel sheet (this is not used for CSV files, but the line must still be filled in)
     except:
         print("Error on line 2: Please enter a string")
         return "ERROR"
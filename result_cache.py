@@ -0,0 +1,101 @@
+#Import other python libraries
+import hashlib #for hashlib.sha256()
+import os
+import pickle #allows me to save the results of each question to a file
+from importlib import metadata #for the versions of the libraries used to work out the results
+
+CACHE_VERSION = 3 #changed whenever the layout of the saved results (or the way they are worked out) changes, so that old results are not used
+
+def library_versions():
+    """
+    Returns the versions of the libraries that affect the results, so that results worked out with other versions are not used
+    """
+    versions = [ ]
+    for library in ("numpy", "matplotlib", "sumy", "nltk"):
+        try:
+            versions.append((library, metadata.version(library)))
+        except metadata.PackageNotFoundError:
+            versions.append((library, None))
+    return tuple(versions)
+
+class ResultCache:
+    """
+    A folder containing the results (statistics, pie chart and summaries) of questions that have already been analysed
+    Each result is saved under a hash of everything that affects it, so a question whose responses have not changed is never analysed again
+    When the folder grows past maxBytes, the results used least recently are deleted
+    """
+    def __init__(self, directory=".survey_cache", maxBytes=200*1024*1024):
+        self.directory = directory #the folder the results are saved in
+        self.maxBytes = maxBytes #the maximum size of the folder
+        self.versions = library_versions()
+
+    def key(self, question, leaveOut, summLen):
+        """
+        Returns the hash of the question type, question number and statement, the number of responses per choice and the settings that affect the results
+        The number of responses per choice is used instead of the responses themselves, since the results do not depend on the order of the responses
+        """
+        qType = question.__class__.__name__
+        summarySettings = (tuple(leaveOut), summLen, question.chunkSize) if qType == "FreeResponseQn" else None #the summary settings only affect free response questions (the number of worker processes does not change the summary)
+        binSettings = (question.maxChoices, question.bins) if qType == "NumericQn" else None #the ranges of the histogram only affect numeric questions
+        digest = hashlib.sha256(repr((CACHE_VERSION, self.versions, qType, question.qNumber, question.qStatement, summarySettings, binSettings)).encode("utf-8"))
+        for choice, freq in question.stats().frequency.items():
+            digest.update(repr((choice, freq)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, question, leaveOut, summLen):
+        """
+        Fills in the results of the question from the cache
+        Returns True if the results were found, or False if the question has to be analysed
+        """
+        path = self._path(self.key(question, leaveOut, summLen))
+        try:
+            with open(path, "rb") as resultFile:
+                result = pickle.load(resultFile)
+            os.utime(path) #marks the result as recently used
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+        question._stats = result["stats"]
+        question._chart = result["chart"]
+        question._summaries = result["summaries"]
+        return True
+
+    def save(self, question, leaveOut, summLen):
+        """
+        Saves the results of the question to the cache
+        The results are written to a temporary file first, so that other processes never read a half-written file
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(self.key(question, leaveOut, summLen))
+        tmpPath = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmpPath, "wb") as resultFile:
+            pickle.dump({"stats": question._stats, "chart": question._chart, "summaries": question._summaries}, resultFile)
+        os.replace(tmpPath, path)
+
+    def evict(self):
+        """
+        Deletes the results used least recently until the folder is no larger than maxBytes
+        """
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".pkl")]
+        except OSError: #the folder has not been created yet
+            return
+        files = [ ]
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError: #the file was deleted by another process (e.g. another survey in batch mode) after the folder was listed
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort() #the oldest results come first
+        totalSize = sum(size for mtime, size, path in files)
+        for mtime, size, path in files:
+            if totalSize <= self.maxBytes:
+                break
+            try:
+                os.remove(path)
+            except OSError: #the file has already been deleted
+                pass
+            totalSize -= size
@@ -0,0 +1,173 @@
+#Import other python libraries
+import hashlib #for hashlib.sha1()
+import string #for string.punctuation
+from collections import Counter, deque #for counting the words in the responses, and for the chunks being summarised
+from concurrent.futures import ProcessPoolExecutor #allows me to summarise several chunks at the same time
+
+#Import other libraries from external sources
+from sumy.summarizers.luhn import LuhnSummarizer #allows me to summarise free response data
+                                                 #the rest of the items imported are also for the summarizer
+from sumy.models.dom import ObjectDocumentModel, Paragraph, Sentence
+from sumy.nlp.stemmers import Stemmer
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.utils import get_stop_words
+
+PUNCTUATION = str.maketrans("", "", string.punctuation) #a translation table that removes all punctuation in a single pass through a string
+
+class WeightedLuhnSummarizer(LuhnSummarizer):
+    """
+    The Luhn summariser, for documents where each sentence stands for several identical responses
+    The significant words are found from word counts multiplied by the weight of each sentence, so they are the same as if every repeat was in the document
+    Each sentence is then rated once, so the summary never repeats a sentence
+    """
+    def __call__(self, document, sentences_count, weights=None):
+        """
+        Returns the best sentences_count sentences of the document, where weights is the number of times each sentence was given
+        """
+        if weights is None: #every sentence was only given once
+            return super().__call__(document, sentences_count)
+        return self._get_best_sentences(document.sentences, sentences_count, self.rate_sentence, self.significant_words(document, weights))
+
+    def significant_words(self, document, weights):
+        """
+        Returns the (stemmed) significant words of the document, counting the words of each sentence as many times as its weight
+        """
+        frequency = Counter() #the weighted number of times each (stemmed) word was used
+        for sentence, weight in zip(document.sentences, weights):
+            for word in map(self.normalize_word, sentence.words):
+                if word not in self._stop_words:
+                    frequency[self.stem_word(word)] += weight
+        best = frequency.most_common(int(sum(frequency.values())*self.significant_percentage)) #takes only the best significant_percentage of the words
+        return frozenset(stem for stem, freq in best if freq > 1) #takes only the words used more than once
+
+class Summariser:
+    """
+    Summarises free responses with the Luhn summariser
+    The tokenizer, stemmer and stop words are only loaded once, when the summariser is created, and are reused for every question
+    Summaries are saved according to the responses, number of sentences and words left out, so the same summary is never worked out twice
+    """
+    def __init__(self, language="english"):
+        """
+        Loads the linguistic resources used by the summariser
+        """
+        self.language = language
+        self.tokenizer = Tokenizer(language) #splits the responses into sentences and words
+        self.luhn = WeightedLuhnSummarizer(Stemmer(language)) #initialises the summariser
+        self.luhn.stop_words = get_stop_words(language) #updates the stop words used for the summariser
+        self._summaries = { } #the summaries already worked out
+
+    @staticmethod
+    def preprocess(responses, leaveOut=[ ]):
+        """
+        Removes all punctuation from the responses and leaves out the irrelevant ones, then collapses repeated responses into one entry each
+        Returns a list of [response, weight] pairs, where the weight is the number of times the response was given
+        Responses count as repeats if they only differ in capital letters, punctuation or spacing, and the first one given is kept
+        The repeats are found with a dictionary (a hash index), so this takes linear time
+
+        >>> Summariser.preprocess(["Making games!", "making  games", "Nil", "Python rocks", None, "Making games."], ["nil"])
+        [['Making games', 3], ['Python rocks', 1]]
+        """
+        unique = { } #the [response, weight] pair of each unique response, saved according to its normalised form
+        for r in responses: #iterates through the responses
+            if r is None: #empty cells in the Excel sheet have nothing to summarise
+                continue
+            r = " ".join(str(r).translate(PUNCTUATION).split()) #removes all punctuation from the current response, along with extra spaces and line breaks
+            normalised = r.lower() #the form of the response used to find repeats
+            if not normalised or normalised in leaveOut: #leaves out irrelevant (and empty) responses
+                continue
+            if normalised in unique:
+                unique[normalised][1] += 1
+            else:
+                unique[normalised] = [r, 1]
+        return list(unique.values()) #dictionaries keep their order, so the responses are in the order they were first given
+
+    @staticmethod
+    def key(responses, sentenceNo, leaveOut):
+        """
+        Returns the key that the summary is saved under
+        The responses are hashed, so that the saved summaries do not keep the responses in memory
+        """
+        digest = hashlib.sha1()
+        for r in responses:
+            digest.update(repr(r).encode("utf-8")) #repr() keeps responses like 1 and "1" apart
+            digest.update(b"\0")
+        return (digest.hexdigest(), sentenceNo, tuple(leaveOut))
+
+    def best(self, unique, sentenceNo):
+        """
+        Returns the sentenceNo [response, weight] pairs (from preprocess()) that best summarise the unique responses, in the order they were given
+        """
+        sentences = [Sentence(r + ".", self.tokenizer) for r, weight in unique] #each unique response is one sentence, with a full stop behind it
+        position = {id(sentence): i for i, sentence in enumerate(sentences)} #the position of each sentence in unique
+        summarized = self.luhn(ObjectDocumentModel([Paragraph(sentences)]), sentenceNo, [weight for r, weight in unique]) #summarises the unique responses, weighted by how often they were given
+        return [unique[position[id(sentence)]] for sentence in summarized]
+
+    def summarize(self, responses, sentenceNo=5, leaveOut=[ ], chunkSize=None, jobs=1):
+        """
+        Returns a summary of the responses (as a list of sentences), excluding irrelevant responses stated in the leaveOut parameter
+        If chunkSize is given, the responses are summarised in chunks of that many responses (in jobs worker processes if jobs is more than 1), and the summary is picked from the summaries of the chunks
+        """
+        summaryKey = self.key(responses, sentenceNo, leaveOut) + (chunkSize,)
+        if summaryKey not in self._summaries: #the summary has not been worked out yet
+            if chunkSize is None or len(responses) <= chunkSize:
+                summarized = self.best(self.preprocess(responses, leaveOut), sentenceNo)
+            else:
+                summarized = self.best(merge(map_chunks(responses, sentenceNo, leaveOut, chunkSize, jobs)), sentenceNo) #the final pass only goes through the best responses of each chunk
+            self._summaries[summaryKey] = [r + "." for r, weight in summarized]
+        return list(self._summaries[summaryKey]) #returns a copy, so that changing it does not change the saved summary
+
+def summarize_chunk(chunk, sentenceNo, leaveOut):
+    """
+    Returns the sentenceNo [response, weight] pairs that best summarise one chunk of responses, using the summariser shared by this process
+    """
+    summariser = get_summariser()
+    return summariser.best(summariser.preprocess(chunk, leaveOut), sentenceNo)
+
+def map_chunks(responses, sentenceNo, leaveOut, chunkSize, jobs=1):
+    """
+    Summarises the responses in chunks of at most chunkSize responses, in jobs worker processes if jobs is more than 1
+    Yields the summary of each chunk, in the same order as the chunks
+    At most two chunks per worker are handed out at a time, so the memory used does not grow with the number of responses
+    """
+    chunkCount = -(-len(responses)//chunkSize) #rounded up
+    chunks = (responses[i::chunkCount] for i in range(chunkCount)) #every chunkCount-th response, so that each chunk is spread across the whole column (the responses of a question are sorted)
+    if jobs <= 1:
+        for chunk in chunks:
+            yield summarize_chunk(chunk, sentenceNo, leaveOut)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=get_summariser) as pool: #each worker loads the summariser once
+        pending = deque() #the chunks handed out to the workers, in order
+        for chunk in chunks:
+            pending.append(pool.submit(summarize_chunk, chunk, sentenceNo, leaveOut))
+            if len(pending) >= jobs*2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def merge(summaries):
+    """
+    Combines the summaries of the chunks into one list of [response, weight] pairs, adding up the weights of responses picked from several chunks
+
+    >>> merge([[["Making games", 3], ["Python rocks", 1]], [["making games", 2]]])
+    [['Making games', 5], ['Python rocks', 1]]
+    """
+    unique = { } #the [response, weight] pair of each response, saved according to its normalised form
+    for summary in summaries:
+        for r, weight in summary:
+            normalised = r.lower() #the responses have already been through preprocess(), so only capital letters can differ
+            if normalised in unique:
+                unique[normalised][1] += weight
+            else:
+                unique[normalised] = [r, weight]
+    return list(unique.values())
+
+_sharedSummariser = None #the summariser shared by every question in this process
+
+def get_summariser():
+    """
+    Returns the summariser shared by every question, creating it the first time it is needed
+    """
+    global _sharedSummariser
+    if _sharedSummariser is None:
+        _sharedSummariser = Summariser()
+    return _sharedSummariser